@@ -14,38 +14,62 @@ OPTIMIZED FOR: 10-15 second YouTube Shorts (maximum retention)
 import os
 import json
 import re
+import copy
 import hashlib
+from collections import deque
+from itertools import islice
 from datetime import datetime
-import google.generativeai as genai
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 TMP = os.getenv("GITHUB_WORKSPACE", ".") + "/tmp"
 os.makedirs(TMP, exist_ok=True)
 HISTORY_FILE = os.path.join(TMP, "content_history.json")
 SCHEDULER_FILE = os.path.join(TMP, "posting_schedule.json")
+HISTORY_LIMIT = 100
 
-# Configure Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+# Words of 5+ letters - the only ones trend validation counts as keywords
+_WORD_RE = re.compile(r"[a-z]{5,}")
+_STOPWORDS = frozenset({
+    'this', 'that', 'with', 'from', 'will', 'just', 'your', 'they',
+    'them', 'what', 'when', 'where', 'which', 'while', 'about',
+    'have', 'been', 'were', 'their', 'there', 'these', 'those',
+    'make', 'made', 'take', 'took', 'very', 'more', 'most', 'some',
+    'other', 'into', 'than', 'then', 'here'
+})
 
-try:
-    models = genai.list_models()
-    model_name = None
-    for m in models:
-        if 'generateContent' in m.supported_generation_methods:
-            if '2.0-flash' in m.name or '2.5-flash' in m.name:
-                model_name = m.name
-                break
-            elif '1.5-flash' in m.name and not model_name:
-                model_name = m.name
+# Gemini client is configured on first use so importing this module stays cheap
+_model = None
+
+
+def get_model():
+    """Configure Gemini and pick the best available flash model (memoized)"""
+    global _model
+    if _model is not None:
+        return _model
     
-    if not model_name:
-        model_name = "models/gemini-1.5-flash"
+    import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
     
-    print(f"✅ Using model: {model_name}")
-    model = genai.GenerativeModel(model_name)
-except Exception as e:
-    print(f"⚠️ Error listing models: {e}")
-    model = genai.GenerativeModel("models/gemini-1.5-flash")
+    try:
+        models = genai.list_models()
+        model_name = None
+        for m in models:
+            if 'generateContent' in m.supported_generation_methods:
+                if '2.0-flash' in m.name or '2.5-flash' in m.name:
+                    model_name = m.name
+                    break
+                elif '1.5-flash' in m.name and not model_name:
+                    model_name = m.name
+        
+        if not model_name:
+            model_name = "models/gemini-1.5-flash"
+        
+        print(f"✅ Using model: {model_name}")
+        _model = genai.GenerativeModel(model_name)
+    except Exception as e:
+        print(f"⚠️ Error listing models: {e}")
+        _model = genai.GenerativeModel("models/gemini-1.5-flash")
+    
+    return _model
 
 
 def load_scheduler_data():
@@ -63,19 +87,25 @@ def load_scheduler_data():
 
 
 def load_history():
-    """Load content history from previous runs"""
+    """Load content history from previous runs (topics held in a bounded deque)"""
     if os.path.exists(HISTORY_FILE):
         try:
             with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
                 history = json.load(f)
-                print(f"📂 Loaded {len(history.get('topics', []))} topics from history")
+                history['topics'] = deque(history.get('topics', []), maxlen=HISTORY_LIMIT)
+                print(f"📂 Loaded {len(history['topics'])} topics from history")
                 return history
         except Exception as e:
             print(f"⚠️ Could not load history: {e}")
-            return {'topics': [], 'version': '2.0'}
+            return {'topics': deque(maxlen=HISTORY_LIMIT), 'version': '2.0'}
     
     print("📂 No previous history found, starting fresh")
-    return {'topics': [], 'version': '2.0'}
+    return {'topics': deque(maxlen=HISTORY_LIMIT), 'version': '2.0'}
+
+
+def recent_topics(topics, n):
+    """Return the last n history entries without copying the whole deque"""
+    return list(islice(topics, max(0, len(topics) - n), None))
 
 
 def save_to_history(topic, script_hash, title, script_data):
@@ -94,21 +124,26 @@ def save_to_history(topic, script_hash, title, script_data):
         'timestamp': datetime.now().timestamp()
     })
     
-    # Keep last 100 topics
-    history['topics'] = history['topics'][-100:]
+    # deque(maxlen=HISTORY_LIMIT) already keeps only the last 100 topics
     history['last_updated'] = datetime.now().isoformat()
     history['version'] = '2.0'
     
     with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
+        json.dump({**history, 'topics': list(history['topics'])}, f, indent=2, ensure_ascii=False)
     
     print(f"💾 Saved to history ({len(history['topics'])} total topics)")
 
 
 def get_content_hash(data):
     """Generate hash of content to detect exact duplicates"""
-    content_str = f"{data.get('title', '')}{data.get('hook', '')}{data.get('bullets', [])}"
-    return hashlib.md5(content_str.encode()).hexdigest()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(data.get('title', '').encode())
+    h.update(b'\x00')
+    h.update(data.get('hook', '').encode())
+    for bullet in data.get('bullets', ()):
+        h.update(b'\x00')
+        h.update(bullet.encode())
+    return h.hexdigest()
 
 
 def load_trending():
@@ -147,33 +182,41 @@ def is_similar_topic(new_title, previous_titles, similarity_threshold=0.6):
     return False
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
 def generate_script_with_retry(prompt):
     """Generate script with automatic retry on failure"""
-    response = model.generate_content(prompt)
-    return response.text.strip()
-
-
-def validate_script_uses_trending_topic(script_data, trending_topics):
-    """Validate that script actually uses one of the trending topics"""
-    if not trending_topics:
-        return True
+    from tenacity import retry, stop_after_attempt, wait_exponential
     
-    script_text = f"{script_data['title']} {script_data['hook']} {' '.join(script_data.get('bullets', []))}".lower()
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    def _generate():
+        response = get_model().generate_content(prompt)
+        return response.text.strip()
     
-    trend_keywords = []
-    for topic in trending_topics:
-        words = [w for w in topic.lower().split() if len(w) > 4 and w not in {
-            'this', 'that', 'with', 'from', 'will', 'just', 'your', 'they',
-            'them', 'what', 'when', 'where', 'which', 'while', 'about',
-            'have', 'been', 'were', 'their', 'there', 'these', 'those',
-            'make', 'made', 'take', 'took', 'very', 'more', 'most', 'some',
-            'other', 'into', 'than', 'then', 'here'
-        }]
-        trend_keywords.extend(words)
+    return _generate()
+
+
+def tokenize(text):
+    """Lowercase text and return its 5+ letter words"""
+    return _WORD_RE.findall(text.lower())
+
+
+def get_script_tokens(script_data):
+    """Tokenize title, hook and bullets once so every validator can share it"""
+    return set(tokenize(f"{script_data['title']} {script_data['hook']} {' '.join(script_data.get('bullets', []))}"))
+
+
+def get_trend_keywords(trending_topics):
+    """Build the trend keyword set once per generation (reused across retries)"""
+    return frozenset(
+        w for topic in trending_topics for w in tokenize(topic) if w not in _STOPWORDS
+    )
+
+
+def validate_script_uses_trending_topic(script_data, trend_keywords, script_tokens=None):
+    """Validate that script actually uses one of the trending topics (trend_keywords from get_trend_keywords)"""
+    if script_tokens is None:
+        script_tokens = get_script_tokens(script_data)
     
-    trend_keywords = list(set(trend_keywords))
-    matches = sum(1 for kw in trend_keywords if kw in script_text)
+    matches = len(trend_keywords & script_tokens)
     
     if matches < 2:
         print(f"⚠️ Script doesn't use trending topics! Only {matches} matches.")
@@ -291,7 +334,7 @@ def build_motivational_prompt(scheduler_data, content_type, priority, intensity,
     print(f"   Keywords: {', '.join(pillar_keywords[:5])}")
     
     # Get previous topics for context
-    previous_topics = [t.get('title', '') for t in history['topics'][-15:]]
+    previous_topics = [t.get('title', '') for t in recent_topics(history['topics'], 15)]
     
     # Extract trending topics
     trending_summaries = []
@@ -411,27 +454,55 @@ def get_time_of_day(hour):
 
 
 def extract_json_from_response(raw_text):
-    """Extract JSON from Gemini response"""
-    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', raw_text, re.DOTALL)
-    if json_match:
-        print("✅ Found JSON in code block")
-        return json_match.group(1)
+    """
+    Extract JSON from Gemini response in a single pass.
+    Walks from the first '{' counting braces (ignoring those inside strings)
+    until the object closes - works for both code blocks and raw JSON.
+    """
+    start = raw_text.find('{')
+    if start == -1:
+        raise ValueError("No JSON found in response")
     
-    json_match = re.search(r'\{.*\}', raw_text, re.DOTALL)
-    if json_match:
-        print("✅ Found raw JSON")
-        return json_match.group(0)
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for i in range(start, len(raw_text)):
+        ch = raw_text[i]
+        
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                print("✅ Found JSON object")
+                return raw_text[start:i + 1]
     
     raise ValueError("No JSON found in response")
 
 
+# Quote cleanup as one translate() pass: drop double quotes, straighten single quotes
+_QUOTE_TABLE = str.maketrans({
+    '"': None,
+    '\u201c': None,
+    '\u201d': None,
+    '\u2018': "'",
+    '\u2019': "'",
+})
+
+
 def clean_script_text(text):
     """Clean script text of problematic characters"""
-    text = text.replace('"', '').replace('"', '')
-    text = text.replace(''', "'").replace(''', "'")
-    text = text.replace('\u2018', "'").replace('\u2019', "'")
-    text = text.replace('\u201c', '').replace('\u201d', '')
-    return text
+    return text.translate(_QUOTE_TABLE)
 
 
 def generate_motivational_script():
@@ -453,8 +524,6 @@ def generate_motivational_script():
     history = load_history()
     trends = load_trending()
     
-    if scheduler_data:
-        print(f"✅ Loaded scheduler data")
     if trends:
         print(f"✅ Loaded trending data from {trends.get('source', 'unknown')}")
         print(f"   Topics: {len(trends.get('topics', []))}")
@@ -464,6 +533,12 @@ def generate_motivational_script():
     # Build prompt using ALL data
     prompt = build_motivational_prompt(scheduler_data, content_type, priority, intensity, trends, history)
     
+    # Trend keywords only depend on the trends payload, so build them once
+    trend_keywords = get_trend_keywords(trends['topics']) if trends and trends.get('topics') else frozenset()
+    
+    # Hash lookup set is built once and reused by every retry
+    existing_hashes = {t.get('hash') for t in history['topics']}
+    
     # Try generating with multiple attempts
     max_attempts = 5
     attempt = 0
@@ -485,12 +560,14 @@ def generate_motivational_script():
             # ✅ NEW: Estimate and validate duration BEFORE accepting
             duration_estimate = estimate_script_duration(data)
             
-            print(f"\n⏱️ Duration Estimate:")
-            print(f"   Total words: {duration_estimate['word_count']}")
-            print(f"   Hook: {duration_estimate['breakdown']['hook']}w")
-            print(f"   Truth: {duration_estimate['breakdown']['truth']}w")
-            print(f"   CTA: {duration_estimate['breakdown']['cta']}w")
-            print(f"   Estimated duration: {duration_estimate['estimated_seconds']}s")
+            print("\n".join([
+                f"\n⏱️ Duration Estimate:",
+                f"   Total words: {duration_estimate['word_count']}",
+                f"   Hook: {duration_estimate['breakdown']['hook']}w",
+                f"   Truth: {duration_estimate['breakdown']['truth']}w",
+                f"   CTA: {duration_estimate['breakdown']['cta']}w",
+                f"   Estimated duration: {duration_estimate['estimated_seconds']}s",
+            ]))
             
             # Reject if estimated duration is outside target range
             if duration_estimate['estimated_seconds'] > 16.0:
@@ -542,19 +619,21 @@ def generate_motivational_script():
                     words = data['title'].split()[:4]
                     data["key_phrase"] = ' '.join(words).upper()
             
+            script_tokens = get_script_tokens(data)
+            
             # Validate trending topics if available
             if trends and trends.get('topics'):
-                if not validate_script_uses_trending_topic(data, trends['topics']):
+                if not validate_script_uses_trending_topic(data, trend_keywords, script_tokens):
                     raise ValueError("Script doesn't use trending topics - regenerating...")
             
             # Check for duplicates
             content_hash = get_content_hash(data)
-            if content_hash in [t.get('hash') for t in history['topics']]:
+            if content_hash in existing_hashes:
                 print("⚠️ Generated duplicate content, regenerating...")
                 raise ValueError("Duplicate content detected")
             
             # Check for similar topics
-            previous_titles = [t.get('title', '') for t in history['topics']]
+            previous_titles = [t.get('title', '') for t in recent_topics(history['topics'], 30)]
             if is_similar_topic(data['title'], previous_titles):
                 print("⚠️ Topic too similar to previous, regenerating...")
                 raise ValueError("Similar topic detected")
@@ -562,13 +641,15 @@ def generate_motivational_script():
             # Success!
             save_to_history(data['topic'], content_hash, data['title'], data)
             
-            print(f"\n✅ SCRIPT GENERATED SUCCESSFULLY")
-            print(f"   Title: {data['title']}")
-            print(f"   Hook: {data['hook']}")
-            print(f"   Key Phrase: {data.get('key_phrase', 'N/A')}")
-            print(f"   Words: {duration_estimate['word_count']}")
-            print(f"   Estimated: {duration_estimate['estimated_seconds']}s")
-            print(f"   Hashtags: {', '.join(data['hashtags'][:5])}")
+            print("\n".join([
+                f"\n✅ SCRIPT GENERATED SUCCESSFULLY",
+                f"   Title: {data['title']}",
+                f"   Hook: {data['hook']}",
+                f"   Key Phrase: {data.get('key_phrase', 'N/A')}",
+                f"   Words: {duration_estimate['word_count']}",
+                f"   Estimated: {duration_estimate['estimated_seconds']}s",
+                f"   Hashtags: {', '.join(data['hashtags'][:5])}",
+            ]))
             
             break
             
@@ -616,65 +697,69 @@ def generate_motivational_script():
     
     print(f"💾 Saved script text for TTS to {script_text_path}")
     
-    # Summary
-    print(f"\n{'='*70}")
-    print(f"📊 GENERATION SUMMARY")
-    print(f"{'='*70}")
-    print(f"Total history: {len(history['topics'])} topics")
-    print(f"Script length: {len(full_script.split())} words")
-    print(f"Estimated duration: {data.get('estimated_duration', 'N/A')}s")
-    print(f"Target: 10-15 seconds")
-    print(f"Visual prompts: {len(data['visual_prompts'])}")
-    
+    # Summary (emitted as one write)
+    summary = [
+        f"\n{'='*70}",
+        f"📊 GENERATION SUMMARY",
+        f"{'='*70}",
+        f"Total history: {len(history['topics'])} topics",
+        f"Script length: {len(full_script.split())} words",
+        f"Estimated duration: {data.get('estimated_duration', 'N/A')}s",
+        f"Target: 10-15 seconds",
+        f"Visual prompts: {len(data['visual_prompts'])}",
+    ]
     if trends:
-        print(f"\n🌐 Trending source: {trends.get('source', 'unknown')}")
+        summary.append(f"\n🌐 Trending source: {trends.get('source', 'unknown')}")
+    print("\n".join(summary))
     
     return data
 
 
+# Built once at import; get_fallback_script deep-copies only the selected entry
+_FALLBACK_SCRIPTS = {
+    'early_morning': {
+        'title': "YOU'RE NOT TIRED YOU'RE UNDISCIPLINED",
+        'hook': "You slept 8 hours. What's the problem.",  # 7 words
+        'bullets': [
+            "You negotiate with weakness. Winners don't wait for motivation."  # 10 words
+        ],
+        'cta': "Set alarm. Get up. Win.",  # 5 words
+        'key_phrase': "DISCIPLINE OVER COMFORT"
+    },
+    'late_night': {
+        'title': "THE TRUTH YOU NEED AT 2 AM",
+        'hook': "You can't sleep. Your potential is haunting you.",  # 8 words
+        'bullets': [
+            "Another day wasted on distraction. Tomorrow you die or rise."  # 11 words
+        ],
+        'cta': "Decide now. Tomorrow is different.",  # 5 words
+        'key_phrase': "THE OLD YOU DIES TONIGHT"
+    },
+    'midday': {
+        'title': "NOBODY IS COMING TO SAVE YOU",
+        'hook': "You're waiting for permission to start living.",  # 7 words
+        'bullets': [
+            "It won't arrive. The cavalry isn't coming. You're alone."  # 10 words
+        ],
+        'cta': "Save yourself. Start now.",  # 4 words
+        'key_phrase': "SAVE YOURSELF"
+    },
+    'evening': {
+        'title': "THE DAY IS OVER. DID YOU WIN?",
+        'hook': "Look at today with brutal honesty.",  # 6 words
+        'bullets': [
+            "Were you busy or productive. You know the difference already."  # 11 words
+        ],
+        'cta': "Plan tomorrow's victory tonight.",  # 4 words
+        'key_phrase': "DID YOU WIN TODAY"
+    }
+}
+
+
 def get_fallback_script(content_type, intensity):
     """Fallback script if all generation attempts fail - OPTIMIZED FOR 10-15s"""
     
-    fallback_scripts = {
-        'early_morning': {
-            'title': "YOU'RE NOT TIRED YOU'RE UNDISCIPLINED",
-            'hook': "You slept 8 hours. What's the problem.",  # 7 words
-            'bullets': [
-                "You negotiate with weakness. Winners don't wait for motivation."  # 10 words
-            ],
-            'cta': "Set alarm. Get up. Win.",  # 5 words
-            'key_phrase': "DISCIPLINE OVER COMFORT"
-        },
-        'late_night': {
-            'title': "THE TRUTH YOU NEED AT 2 AM",
-            'hook': "You can't sleep. Your potential is haunting you.",  # 8 words
-            'bullets': [
-                "Another day wasted on distraction. Tomorrow you die or rise."  # 11 words
-            ],
-            'cta': "Decide now. Tomorrow is different.",  # 5 words
-            'key_phrase': "THE OLD YOU DIES TONIGHT"
-        },
-        'midday': {
-            'title': "NOBODY IS COMING TO SAVE YOU",
-            'hook': "You're waiting for permission to start living.",  # 7 words
-            'bullets': [
-                "It won't arrive. The cavalry isn't coming. You're alone."  # 10 words
-            ],
-            'cta': "Save yourself. Start now.",  # 4 words
-            'key_phrase': "SAVE YOURSELF"
-        },
-        'evening': {
-            'title': "THE DAY IS OVER. DID YOU WIN?",
-            'hook': "Look at today with brutal honesty.",  # 6 words
-            'bullets': [
-                "Were you busy or productive. You know the difference already."  # 11 words
-            ],
-            'cta': "Plan tomorrow's victory tonight.",  # 4 words
-            'key_phrase': "DID YOU WIN TODAY"
-        }
-    }
-
-    selected = fallback_scripts.get(content_type, fallback_scripts['midday'])
+    selected = copy.deepcopy(_FALLBACK_SCRIPTS.get(content_type, _FALLBACK_SCRIPTS['midday']))
     
     return {
         'title': selected['title'],
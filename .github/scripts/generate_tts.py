@@ -14,12 +14,77 @@ OPTIMIZED FOR: 10-15 second target duration
 """
 
 import os
+
+# Keep BLAS/OpenMP from oversubscribing CI cores on small TTS matmuls.
+# Must be set before torch is imported (torch is only pulled in via TTS).
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+
+import re
 import json
+import hashlib
+import shutil
+import asyncio
+import socket
+import sys
+import time
 from pathlib import Path
 import subprocess
+from functools import lru_cache
+from itertools import accumulate, islice
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+from contextlib import ExitStack, nullcontext
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 TMP = os.getenv("GITHUB_WORKSPACE", ".") + "/tmp"
 os.makedirs(TMP, exist_ok=True)
+SCRIPT_FILE = os.path.join(TMP, "script.json")
+VOICE_FILE = os.path.join(TMP, "voice.mp3")
+TIMING_FILE = os.path.join(TMP, "audio_timing.json")
+METADATA_FILE = os.path.join(TMP, "audio_metadata.json")
+TTS_CACHE_DIR = os.path.join(TMP, "tts_cache")
+TOKEN_CACHE_FILE = os.path.join(TTS_CACHE_DIR, "token_ids.json")
+TTS_CACHE_MAX_ENTRIES = 20  # voiceovers kept in TTS_CACHE_DIR (restored between runs)
+
+# Intra-op threads for CPU inference (half the cores unless overridden)
+TORCH_NUM_THREADS = int(os.getenv('TTS_NUM_THREADS', max(1, (os.cpu_count() or 2) // 2)))
+
+# Set USE_COQUI=0 to go straight to espeak (skips importing TTS/torch entirely)
+USE_COQUI = os.getenv('USE_COQUI', '1') == '1'
+
+# Concurrent section syntheses; by default sized so workers x torch threads <= cores
+TTS_SECTION_WORKERS = int(os.getenv(
+    'TTS_SECTION_WORKERS', max(1, (os.cpu_count() or 1) // TORCH_NUM_THREADS)
+))
+
+# Opt-in warm worker (tts_worker.py) that keeps the model loaded between runs
+USE_TTS_WORKER = os.getenv('TTS_WORKER', '0') == '1'
+TTS_WORKER_SOCKET = os.getenv('TTS_WORKER_SOCKET', os.path.join(tempfile.gettempdir(), 'the5amlegion_tts.sock'))
+TTS_WORKER_STARTUP_TIMEOUT = int(os.getenv('TTS_WORKER_STARTUP_TIMEOUT', '300'))
+TTS_WORKER_JOB_TIMEOUT = int(os.getenv('TTS_WORKER_JOB_TIMEOUT', '300'))
+
+# Let ffmpeg run the enhancement filter graph on all cores
+FFMPEG_FILTER_THREADS = os.cpu_count() or 1
+
+# Set TTS_VERBOSE=0 to drop per-call speaker diagnostics from CI logs
+TTS_VERBOSE = os.getenv('TTS_VERBOSE', '1') == '1'
+
+# Optional warm-start snapshots of loaded models (e.g. ~/.cache/tts-snapshots)
+TTS_SNAPSHOT_DIR = os.path.expanduser(os.getenv('TTS_SNAPSHOT_DIR', ''))
+
+# Optional int8-quantized ONNX export of the primary VITS model for CPU inference
+# (e.g. ~/.local/share/tts/onnx/vctk_vits_int8.onnx); exported on first use
+TTS_ONNX_MODEL = os.path.expanduser(os.getenv('TTS_ONNX_MODEL', ''))
+
+# Silence Coqui's Synthesizer appends after every sentence (kept for ONNX parity)
+SENTENCE_SILENCE_SAMPLES = 10000
 
 # 🔥 MOTIVATIONAL TTS CONFIGURATION (from PRD)
 PRIMARY_MODEL = "tts_models/en/vctk/vits"
@@ -32,6 +97,9 @@ MALE_SPEAKERS = {
     'p287': 'Rich cinematic male voice'
 }
 
+# Lowercased once for O(1) lookups against a model's speaker map
+MALE_SPEAKERS_LOWER = tuple(s.lower() for s in MALE_SPEAKERS)
+
 FALLBACK_MODELS = [
     "tts_models/en/ljspeech/tacotron2-DDC",
     "tts_models/en/ljspeech/glow-tts",
@@ -47,6 +115,17 @@ SPEED_SETTINGS = {
     'general': 0.80          # Default: 20% slower (was 0.75)
 }
 
+# Base WPM by content type
+BASE_WPM = {
+    'early_morning': 120,    # Faster wake-up energy
+    'late_night': 100,       # Slower, intimate
+    'midday': 130,           # Urgent midday push
+    'evening': 110,          # Reflective
+    'general': 110           # Default
+}
+
+_SENTENCE_END = frozenset('.!?')
+
 # 🔥 INTENSITY-BASED SPEAKER SELECTION (Correct males only)
 SPEAKER_BY_INTENSITY = {
     'aggressive': 'p376',      # Most intense and passionate
@@ -54,17 +133,63 @@ SPEAKER_BY_INTENSITY = {
     'inspirational': 'p287'    # Rich and uplifting
 }
 
+# espeak pause markers - '...' must come before '.' in the alternation
+_PAUSE_RE = re.compile(r'\.\.\.|[.?]')
+# Primary-model errors caused by the input text rather than the model itself:
+# Coqui's tokenizer KeyError for an unknown character, and its ValueError for empty text
+_TEXT_ERROR_MESSAGES = {
+    KeyError: "is not in the vocabulary",
+    ValueError: "You need to define either `text`",
+}
+
+_PAUSE_MAP = {
+    '...': ' [[400]] ',  # REDUCED from 500ms
+    '.': '. [[250]] ',   # REDUCED from 300ms
+    '?': '? [[350]] '    # REDUCED from 400ms
+}
+
+
+def read_json(path):
+    """Parse a JSON file (orjson when installed, stdlib json otherwise)"""
+    # Unbuffered: readall() sizes one read from fstat, no intermediate buffer copy
+    with open(path, 'rb', buffering=0) as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def write_json(path, obj):
+    """Write obj as 2-space indented JSON in a single write"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(obj, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
+def is_valid_output(path, min_size=1000):
+    """True if path exists and is larger than min_size bytes (one stat call)"""
+    try:
+        return os.stat(path).st_size > min_size
+    except OSError:
+        return False
+
 
 def load_script():
     """Load the generated script"""
-    script_path = os.path.join(TMP, "script.json")
+    script_path = SCRIPT_FILE
     
     if not os.path.exists(script_path):
-        print("❌ Script file not found!")
-        exit(1)
+        raise FileNotFoundError(f"Script file not found: {script_path}")
     
-    with open(script_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json(script_path)
+
+
+def ensure_sentence_end(text):
+    """Terminate text with a period unless it already ends a sentence"""
+    if not text or text[-1] not in _SENTENCE_END:
+        text += '.'
+    return text
 
 
 def build_tts_text_with_pauses(script_data):
@@ -88,40 +213,39 @@ def build_tts_text_with_pauses(script_data):
     
     # Hook section
     if hook:
-        hook_text = hook.strip()
         # Ensure it ends with proper punctuation
-        if not hook_text.endswith(('.', '!', '?')):
-            hook_text += '.'
+        hook_text = ensure_sentence_end(hook.strip())
         
         tts_sections.append({
             'name': 'hook',
             'text': hook_text,
+            'word_count': len(hook_text.split()),
+            'pause_count': hook_text.count('...'),
             'pause_after': 0.3  # REDUCED from 0.5s for tighter pacing
         })
     
     # Bullet sections
     for i, bullet in enumerate(bullets):
-        bullet_text = bullet.strip()
-        
         # Ensure proper punctuation
-        if not bullet_text.endswith(('.', '!', '?')):
-            bullet_text += '.'
+        bullet_text = ensure_sentence_end(bullet.strip())
         
         tts_sections.append({
             'name': f'bullet_{i}',
             'text': bullet_text,
+            'word_count': len(bullet_text.split()),
+            'pause_count': bullet_text.count('...'),
             'pause_after': 0.5  # KEEP at 0.5s - this is the "truth bomb" moment
         })
     
     # CTA section
     if cta:
-        cta_text = cta.strip()
-        if not cta_text.endswith(('.', '!', '?')):
-            cta_text += '.'
+        cta_text = ensure_sentence_end(cta.strip())
         
         tts_sections.append({
             'name': 'cta',
             'text': cta_text,
+            'word_count': len(cta_text.split()),
+            'pause_count': cta_text.count('...'),
             'pause_after': 0.3  # REDUCED from 0.5s for tighter finish
         })
     
@@ -134,18 +258,9 @@ def build_tts_text_with_pauses(script_data):
     full_text = ' '.join(full_text_parts)
     
     # ✅ MODIFIED: Enhanced duration calculation with validation
-    word_count = len(full_text.split())
-    
-    # Base WPM by content type
-    base_wpm = {
-        'early_morning': 120,    # Faster wake-up energy
-        'late_night': 100,       # Slower, intimate
-        'midday': 130,           # Urgent midday push
-        'evening': 110,          # Reflective
-        'general': 110           # Default
-    }
+    word_count = sum(section['word_count'] for section in tts_sections)
     
-    wpm = base_wpm.get(content_type, 110)
+    wpm = BASE_WPM.get(content_type, 110)
     pause_time = sum(section['pause_after'] for section in tts_sections)
     word_time = (word_count / wpm) * 60
     
@@ -189,72 +304,560 @@ def build_tts_text_with_pauses(script_data):
     return full_text, tts_sections, estimated_duration
 
 
+# Snapshots that failed to load this run; rebuilding must not re-pickle them
+_broken_snapshots = set()
+
+
+def get_snapshot_path(model_name):
+    """
+    Snapshot file for a model, versioned by the installed TTS and torch releases
+    (the pickle holds both libraries' classes; the workflow's snapshot cache key
+    uses the same two versions)
+    """
+    if not TTS_SNAPSHOT_DIR:
+        return None
+    
+    import TTS
+    import torch
+    tts_version = getattr(TTS, '__version__', 'unknown')
+    torch_version = torch.__version__.replace('+', '_')
+    name = f"{model_name.replace('/', '--')}-{tts_version}-torch{torch_version}.pt"
+    return os.path.join(TTS_SNAPSHOT_DIR, name)
+
+
+def load_tts_snapshot(model_name):
+    """Load a previously pickled TTS object (skips config parsing and model rebuild)"""
+    snapshot_path = get_snapshot_path(model_name)
+    if not snapshot_path or not os.path.exists(snapshot_path):
+        return None
+    
+    try:
+        import torch
+        tts = torch.load(snapshot_path, map_location='cpu', weights_only=False)
+        print(f"   ⚡ Warm-started from snapshot: {snapshot_path}")
+        return tts
+    except Exception as e:
+        print(f"   ⚠️ Snapshot load failed, deleting it and rebuilding: {e}")
+        _broken_snapshots.add(snapshot_path)
+        try:
+            os.remove(snapshot_path)
+        except OSError:
+            pass
+        return None
+
+
+def save_tts_snapshot(tts, model_name):
+    """Pickle the freshly loaded (CPU) TTS object for the next run"""
+    snapshot_path = get_snapshot_path(model_name)
+    if not snapshot_path:
+        return
+    if snapshot_path in _broken_snapshots:
+        # Same TTS/torch versions produced an unloadable pickle; a fresh one
+        # would hit the same cache key and never be persisted anyway
+        print("   ⚠️ Skipping snapshot save (previous snapshot for these versions was unloadable)")
+        return
+    
+    try:
+        import torch
+        os.makedirs(TTS_SNAPSHOT_DIR, exist_ok=True)
+        # Write then rename so an interrupted save never leaves a truncated snapshot
+        torch.save(tts, snapshot_path + '.tmp')
+        os.replace(snapshot_path + '.tmp', snapshot_path)
+        print(f"   💾 Saved model snapshot: {snapshot_path}")
+    except Exception as e:
+        print(f"   ⚠️ Could not save snapshot: {e}")
+
+
+@lru_cache(maxsize=1)
+def import_tts_api():
+    """Import Coqui's TTS class once per process; None if it isn't installed"""
+    try:
+        from TTS.api import TTS
+        return TTS
+    except ImportError as e:
+        print(f"⚠️ Coqui TTS not available: {e}")
+        return None
+
+
+@lru_cache(maxsize=4)
+def get_tts(model_name):
+    """
+    Load a Coqui TTS model once per process and reuse it across calls/fallbacks.
+    
+    Model weights live in ~/.local/share/tts (cached by the workflow). When
+    TTS_SNAPSHOT_DIR is set, the loaded object is also pickled there so the
+    next run can skip config parsing and model construction.
+    """
+    TTS = import_tts_api()
+    if TTS is None:
+        raise ImportError("Coqui TTS not available")
+    
+    print(f"🔊 Loading Coqui TTS model: {model_name}")
+    tts = load_tts_snapshot(model_name)
+    if tts is None:
+        tts = TTS(model_name=model_name, progress_bar=False)
+        save_tts_snapshot(tts, model_name)
+    
+    # Move to GPU when one is available (CPU stays the default on CI runners)
+    tts.use_cuda = False
+    try:
+        import torch
+        torch.set_num_threads(TORCH_NUM_THREADS)
+        if torch.cuda.is_available():
+            torch.backends.cudnn.benchmark = True
+            tts = tts.to('cuda')
+            tts.use_cuda = True
+            print(f"   🚀 Using CUDA ({torch.cuda.get_device_name(0)})")
+    except Exception as e:
+        print(f"   ⚠️ GPU setup failed, using CPU: {e}")
+    
+    # Lowercase -> canonical speaker map, built once per loaded model
+    speakers = getattr(tts, 'speakers', None) or []
+    tts.speaker_map = {str(s).lower(): str(s) for s in speakers}
+    tts.onnx_ready = model_name == PRIMARY_MODEL and load_onnx_model(tts)
+    return tts
+
+
+def load_onnx_model(tts):
+    """
+    Attach an int8 ONNX Runtime session to the loaded VITS model.
+    The first run exports the model to ONNX and applies dynamic int8
+    quantization; later runs load TTS_ONNX_MODEL directly (CPU only).
+    """
+    if not TTS_ONNX_MODEL or tts.use_cuda:
+        return False
+    
+    model = getattr(getattr(tts, 'synthesizer', None), 'tts_model', None)
+    if model is None or not hasattr(model, 'load_onnx'):
+        return False
+    
+    try:
+        if not os.path.exists(TTS_ONNX_MODEL):
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            
+            print(f"   🧮 Exporting int8 ONNX model: {TTS_ONNX_MODEL}")
+            os.makedirs(os.path.dirname(TTS_ONNX_MODEL) or '.', exist_ok=True)
+            fp32_path = TTS_ONNX_MODEL + '.fp32'
+            model.export_onnx(output_path=fp32_path, verbose=False)
+            quantize_dynamic(fp32_path, TTS_ONNX_MODEL, weight_type=QuantType.QInt8)
+            os.remove(fp32_path)
+        
+        model.load_onnx(TTS_ONNX_MODEL, cuda=False)
+        print(f"   ⚡ Using int8 ONNX Runtime model")
+        return True
+    except Exception as e:
+        print(f"   ⚠️ ONNX model unavailable, using PyTorch: {e}")
+        return False
+
+
+_token_cache = None
+
+
+def get_token_ids(model, text):
+    """
+    Phoneme/token IDs for text, memoized on disk so repeated fragments
+    (CTAs, recurring hooks) skip text normalization and G2P.
+    """
+    global _token_cache
+    if _token_cache is None:
+        try:
+            _token_cache = read_json(TOKEN_CACHE_FILE)
+        except (OSError, ValueError):
+            _token_cache = {}
+    
+    key = hashlib.blake2b(f"{PRIMARY_MODEL}\x00{text}".encode('utf-8'), digest_size=16).hexdigest()
+    ids = _token_cache.get(key)
+    if ids is None:
+        ids = _token_cache[key] = list(model.tokenizer.text_to_ids(text))
+    return ids
+
+
+def save_token_cache():
+    """Persist token IDs gathered this run next to the voiceover cache"""
+    if not _token_cache:
+        return
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        write_json(TOKEN_CACHE_FILE, _token_cache)
+    except OSError as e:
+        print(f"⚠️ Could not save token cache: {e}")
+
+
+def synthesize_sentence_onnx(tts, sentence, speaker):
+    """Tokenize one sentence and run it through the ONNX Runtime session"""
+    import numpy as np
+    
+    model = tts.synthesizer.tts_model
+    x = np.asarray([get_token_ids(model, sentence)], dtype=np.int64)
+    speaker_idx = model.speaker_manager.name_to_id[speaker] if speaker else None
+    
+    wav = np.asarray(model.inference_onnx(x, speaker_id=speaker_idx), dtype=np.float32).reshape(-1)
+    return np.concatenate([wav, np.zeros(SENTENCE_SILENCE_SAMPLES, dtype=np.float32)])
+
+
+def inference_context(tts):
+    """No-grad inference; adds FP16 autocast when the model runs on CUDA"""
+    try:
+        import torch
+    except ImportError:
+        return nullcontext()
+    
+    stack = ExitStack()
+    stack.enter_context(torch.inference_mode())
+    if getattr(tts, 'use_cuda', False):
+        stack.enter_context(torch.autocast('cuda', dtype=torch.float16))
+    return stack
+
+
+def resolve_speaker(tts, speaker_id):
+    """
+    Pick the speaker to use for a loaded model.
+    Returns None for single-speaker models (no speaker parameter needed).
+    """
+    # ✅ Check if model supports multiple speakers
+    has_speakers = hasattr(tts, 'speakers') and tts.speakers is not None
+    
+    if not has_speakers:
+        if TTS_VERBOSE:
+            print(f"   📢 Single-speaker model (no speaker selection)")
+        return None
+    
+    if TTS_VERBOSE:
+        print(f"   📢 Multi-speaker model detected")
+        print(f"   🎭 Available speakers: {len(tts.speakers)}")
+    
+    # Verify speaker exists (case-insensitive O(1) lookup)
+    speaker_map = tts.speaker_map
+    
+    canonical = speaker_map.get(speaker_id.lower())
+    if canonical:
+        speaker_id = canonical
+    else:
+        print(f"   ⚠️ Speaker '{speaker_id}' not in model")
+        if TTS_VERBOSE:
+            print(f"   Available: {', '.join(map(str, islice(tts.speakers, 10)))}")
+        
+        # Try to find best male alternative
+        alt_speaker = next((speaker_map[a] for a in MALE_SPEAKERS_LOWER if a in speaker_map), None)
+        if alt_speaker:
+            speaker_id = alt_speaker
+            print(f"   ✅ Using alternative male speaker: {speaker_id}")
+        else:
+            # Use first available speaker as last resort
+            speaker_id = str(tts.speakers[0])
+            print(f"   🔄 Using first available: {speaker_id}")
+    
+    return speaker_id
+
+
+def synthesize_to_file(tts, text, output_path, speaker_id, speed):
+    """
+    Run one synthesis on a loaded model (shared by in-process and worker paths).
+    Sentences are synthesized one at a time and piped into the MP3 encoder,
+    skipping tts_to_file's intermediate WAV.
+    """
+    speaker = resolve_speaker(tts, speaker_id)
+    
+    # Only pass speaker parameter to multi-speaker models
+    speaker_kwargs = {'speaker': speaker} if speaker else {}
+    
+    synthesizer = getattr(tts, 'synthesizer', None)
+    if synthesizer is not None and hasattr(synthesizer, 'split_into_sentences'):
+        def stream_sentences():
+            # Same sentence split tts_to_file uses; each tts() call returns the
+            # sentence audio plus Coqui's usual inter-sentence silence
+            for sentence in synthesizer.split_into_sentences(text):
+                if getattr(tts, 'onnx_ready', False):
+                    yield synthesize_sentence_onnx(tts, sentence, speaker)
+                    continue
+                with inference_context(tts):
+                    wav = tts.tts(text=sentence, speed=speed, **speaker_kwargs)
+                yield wav
+        
+        encode_pcm_to_mp3(stream_sentences(), synthesizer.output_sample_rate, output_path)
+        save_token_cache()
+        return
+    
+    with inference_context(tts):
+        tts.tts_to_file(
+            text=text,
+            file_path=output_path,
+            speed=speed,
+            **speaker_kwargs
+        )
+
+
+def start_tts_worker():
+    """Launch tts_worker.py detached and wait for its socket to appear"""
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tts_worker.py")
+    log_path = os.path.join(TMP, "tts_worker.log")
+    
+    print(f"   🚀 Starting TTS worker (log: {log_path})")
+    with open(log_path, 'ab') as log:
+        proc = subprocess.Popen(
+            [sys.executable, worker_script],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, 'PYTHONUNBUFFERED': '1'},
+            start_new_session=True
+        )
+    
+    deadline = time.monotonic() + TTS_WORKER_STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if os.path.exists(TTS_WORKER_SOCKET):
+            return True
+        if proc.poll() is not None:
+            print(f"   ⚠️ TTS worker exited during startup (code {proc.returncode}, see {log_path})")
+            return False
+        time.sleep(0.25)
+    
+    print(f"   ⚠️ TTS worker did not start within {TTS_WORKER_STARTUP_TIMEOUT}s")
+    return False
+
+
+def synthesize_via_worker(text, output_path, speaker_id, speed, model_name=PRIMARY_MODEL):
+    """
+    Send a synthesis job to the warm TTS worker over its Unix socket.
+    Returns False (caller synthesizes in-process) on any worker problem.
+    """
+    try:
+        if not os.path.exists(TTS_WORKER_SOCKET) and not start_tts_worker():
+            return False
+        
+        job = {
+            'text': text,
+            'speaker': speaker_id,
+            'speed': speed,
+            'out': os.path.abspath(output_path),
+            'model': model_name
+        }
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(TTS_WORKER_JOB_TIMEOUT)
+            try:
+                sock.connect(TTS_WORKER_SOCKET)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Stale socket left by a worker that already exited
+                if os.path.exists(TTS_WORKER_SOCKET):
+                    os.remove(TTS_WORKER_SOCKET)
+                if not start_tts_worker():
+                    return False
+                sock.connect(TTS_WORKER_SOCKET)
+            sock.sendall((json.dumps(job) + '\n').encode('utf-8'))
+            with sock.makefile('rb') as reply_file:
+                reply = json.loads(reply_file.readline() or b'{}')
+        
+        if not reply.get('ok'):
+            print(f"   ⚠️ TTS worker error: {reply.get('error', 'no reply')}")
+            return False
+        
+        return is_valid_output(output_path)
+        
+    except Exception as e:
+        print(f"   ⚠️ TTS worker unavailable: {e}")
+        return False
+
+
 def generate_audio_coqui(text, output_path, speaker_id, speed=0.80):
     """
     Generate audio using Coqui TTS with proper speaker parameter handling
     OPTIMIZED FOR: 10-15 second target
+    
+    Returns (success, error) so the caller can tell why synthesis failed.
     """
     try:
-        from TTS.api import TTS
+        if TTS_VERBOSE:
+            print(f"   🎤 Target speaker: {speaker_id} ({MALE_SPEAKERS.get(speaker_id, 'Unknown')})")
+            print(f"   ⚡ Speed: {speed}x (optimized for 10-15s target)")
         
-        print(f"🔊 Loading Coqui TTS model: {PRIMARY_MODEL}")
-        print(f"   🎤 Target speaker: {speaker_id} ({MALE_SPEAKERS.get(speaker_id, 'Unknown')})")
-        print(f"   ⚡ Speed: {speed}x (optimized for 10-15s target)")
+        if USE_TTS_WORKER and synthesize_via_worker(text, output_path, speaker_id, speed):
+            print(f"✅ Coqui TTS generated by warm worker")
+            return True, None
         
-        tts = TTS(model_name=PRIMARY_MODEL, progress_bar=False)
+        tts = get_tts(PRIMARY_MODEL)
+        synthesize_to_file(tts, text, output_path, speaker_id, speed)
         
-        # ✅ Check if model supports multiple speakers
-        has_speakers = hasattr(tts, 'speakers') and tts.speakers is not None
+        # Verify output
+        if is_valid_output(output_path):
+            print(f"✅ Coqui TTS generated successfully")
+            return True, None
+        else:
+            print(f"⚠️ Output file invalid or too small")
+            return False, None
         
-        if has_speakers:
-            print(f"   📢 Multi-speaker model detected")
-            print(f"   🎭 Available speakers: {len(tts.speakers)}")
+    except Exception as e:
+        print(f"⚠️ Coqui TTS failed: {e}")
+        return False, e
+
+
+def should_skip_fallback_models(error):
+    """
+    True when the primary failure would repeat on every fallback model:
+    Coqui isn't installed, or the text itself couldn't be processed.
+    """
+    if isinstance(error, ImportError):
+        return True
+    message = _TEXT_ERROR_MESSAGES.get(type(error))
+    return message is not None and message in str(error)
+
+
+def peak_normalize(wav, full_scale=1.0):
+    """Scale a float waveform so its peak hits full_scale, as Coqui's save_wav does"""
+    import numpy as np
+    
+    wav = np.asarray(wav, dtype=np.float32)
+    return wav * (full_scale / max(0.01, float(np.max(np.abs(wav), initial=0.0))))
+
+
+def encode_pcm_to_mp3(chunks, sample_rate, output_path):
+    """
+    Pipe float waveform chunks into ffmpeg as 16-bit PCM and encode MP3.
+    The joined waveform is peak-normalized first (same loudness as
+    tts_to_file), so chunks are collected before anything is written.
+    """
+    import numpy as np
+    
+    cmd = [
+        'ffmpeg',
+        '-f', 's16le',
+        '-ar', str(sample_rate),
+        '-ac', '1',
+        '-i', 'pipe:0',
+        '-codec:a', 'libmp3lame',
+        '-b:a', '192k',
+        '-y',
+        output_path
+    ]
+    ffmpeg = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wav = np.concatenate([np.asarray(chunk, dtype=np.float32).ravel() for chunk in chunks])
+        ffmpeg.stdin.write(peak_normalize(wav, 32767).astype(np.int16).tobytes())
+    finally:
+        ffmpeg.stdin.close()
+        ffmpeg.wait()
+    
+    if ffmpeg.returncode != 0:
+        raise subprocess.CalledProcessError(ffmpeg.returncode, cmd)
+
+
+def synthesize_sections_batched(tts, tts_sections, speaker):
+    """
+    Run every section through the VITS model in one padded forward pass.
+    Returns one waveform (numpy float array) per section, in order.
+    """
+    import torch
+    from torch.nn.utils.rnn import pad_sequence
+    
+    model = tts.synthesizer.tts_model
+    device = next(model.parameters()).device
+    
+    token_ids = [
+        torch.tensor(get_token_ids(model, section['text']), dtype=torch.long)
+        for section in tts_sections
+    ]
+    save_token_cache()
+    x = pad_sequence(token_ids, batch_first=True).to(device)
+    aux_input = {'x_lengths': torch.tensor([len(ids) for ids in token_ids], dtype=torch.long, device=device)}
+    
+    if speaker is not None:
+        speaker_idx = model.speaker_manager.name_to_id[speaker]
+        aux_input['speaker_ids'] = torch.full((len(token_ids),), speaker_idx, dtype=torch.long, device=device)
+    
+    with inference_context(tts):
+        outputs = model.inference(x, aux_input=aux_input)
+    
+    # y_mask marks each item's real (unpadded) frames
+    hop_length = model.config.audio.hop_length
+    wav_lengths = (outputs['y_mask'].sum(dim=(1, 2)) * hop_length).long().tolist()
+    waves = outputs['model_outputs'].squeeze(1).float().cpu().numpy()
+    return [waves[i, :length] for i, length in enumerate(wav_lengths)]
+
+
+def generate_audio_coqui_sections(tts_sections, output_path, speaker_id, speed=0.80):
+    """
+    Synthesize the sections separately and join them with explicit
+    pause_after silences (instead of relying on punctuation).
+    Tries one batched VITS forward pass first; falls back to concurrent
+    per-section tts_to_file calls joined with ffmpeg.
+    Enabled with TTS_PARALLEL_SECTIONS=1.
+    """
+    try:
+        tts = get_tts(PRIMARY_MODEL)
+        speaker = resolve_speaker(tts, speaker_id)
+        speaker_kwargs = {'speaker': speaker} if speaker else {}
+        
+        try:
+            print(f"   🧩 Batched section synthesis ({len(tts_sections)} sections)")
+            import numpy as np
             
-            # Verify speaker exists (case-insensitive check)
-            available_speakers = [str(s).lower() for s in tts.speakers]
-            speaker_lower = speaker_id.lower()
+            waves = synthesize_sections_batched(tts, tts_sections, speaker)
+            sample_rate = tts.synthesizer.output_sample_rate
             
-            if speaker_lower not in available_speakers:
-                print(f"   ⚠️ Speaker '{speaker_id}' not in model")
-                print(f"   Available: {list(tts.speakers)[:10]}")
-                
-                # Try to find best male alternative
-                for alt_speaker in MALE_SPEAKERS.keys():
-                    if alt_speaker.lower() in available_speakers:
-                        speaker_id = alt_speaker
-                        print(f"   ✅ Using alternative male speaker: {speaker_id}")
-                        break
-                else:
-                    # Use first available speaker as last resort
-                    speaker_id = str(tts.speakers[0])
-                    print(f"   🔄 Using first available: {speaker_id}")
+            def with_pauses():
+                # Per-section peaks, like the tts_to_file fallback below
+                for wave, section in zip(waves, tts_sections):
+                    yield peak_normalize(wave)
+                    yield np.zeros(int(sample_rate * section['pause_after']), dtype=np.float32)
             
-            # Generate with speaker parameter
-            tts.tts_to_file(
-                text=text,
-                speaker=speaker_id,
-                file_path=output_path,
-                speed=speed
-            )
-        else:
-            print(f"   📢 Single-speaker model (no speaker selection)")
-            # Generate without speaker parameter
-            tts.tts_to_file(
-                text=text,
-                file_path=output_path,
-                speed=speed
-            )
+            encode_pcm_to_mp3(with_pauses(), sample_rate, output_path)
+            
+            if is_valid_output(output_path):
+                print(f"✅ Coqui TTS sections generated in one batch")
+                return True
+        except Exception as e:
+            print(f"   ⚠️ Batched synthesis unavailable ({e}), synthesizing sections concurrently")
         
-        # Verify output
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-            print(f"✅ Coqui TTS generated successfully")
+        print(f"   🧩 Parallel section synthesis ({len(tts_sections)} sections)")
+        
+        with tempfile.TemporaryDirectory(dir=TMP) as work_dir:
+            def synthesize(indexed_section):
+                i, section = indexed_section
+                section_path = os.path.join(work_dir, f"section_{i}.wav")
+                with inference_context(tts):
+                    tts.tts_to_file(
+                        text=section['text'],
+                        file_path=section_path,
+                        speed=speed,
+                        **speaker_kwargs
+                    )
+                return section_path
+            
+            workers = min(len(tts_sections), TTS_SECTION_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                section_paths = list(executor.map(synthesize, enumerate(tts_sections)))
+            
+            # Pad every section with its pause, then concatenate in order
+            cmd = ['ffmpeg']
+            for section_path in section_paths:
+                cmd += ['-i', section_path]
+            
+            filters = [
+                f"[{i}:a]apad=pad_dur={section['pause_after']}[a{i}]"
+                for i, section in enumerate(tts_sections)
+            ]
+            labels = ''.join(f"[a{i}]" for i in range(len(tts_sections)))
+            filters.append(f"{labels}concat=n={len(tts_sections)}:v=0:a=1[out]")
+            
+            cmd += [
+                '-filter_complex_threads', str(FFMPEG_FILTER_THREADS),
+                '-filter_complex', ';'.join(filters),
+                '-map', '[out]',
+                '-codec:a', 'libmp3lame',
+                '-b:a', '192k',
+                '-y',
+                output_path
+            ]
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        if is_valid_output(output_path):
+            print(f"✅ Coqui TTS sections generated and joined")
             return True
-        else:
-            print(f"⚠️ Output file invalid or too small")
-            return False
+        
+        print(f"⚠️ Joined output invalid or too small")
+        return False
         
     except Exception as e:
-        print(f"⚠️ Coqui TTS failed: {e}")
+        print(f"⚠️ Parallel section synthesis failed: {e}")
         return False
 
 
@@ -266,8 +869,6 @@ def generate_audio_espeak(text, output_path, speed_factor=0.80):
     
     print(f"🔊 Using espeak fallback...")
     
-    content_type = os.getenv('CONTENT_TYPE', 'general')
-    
     # ✅ MODIFIED: Adjusted espeak speed for tighter timing
     base_speed = 140  # Increased from 135 for faster delivery
     speed = int(base_speed * speed_factor)
@@ -283,39 +884,41 @@ def generate_audio_espeak(text, output_path, speed_factor=0.80):
     print(f"   Gap: {gap}ms (optimized pauses)")
     
     # Replace pauses with espeak pause syntax
-    text_with_pauses = text.replace('...', ' [[400]] ')  # REDUCED from 500ms
-    text_with_pauses = text_with_pauses.replace('.', '. [[250]] ')  # REDUCED from 300ms
-    text_with_pauses = text_with_pauses.replace('?', '? [[350]] ')  # REDUCED from 400ms
+    text_with_pauses = _PAUSE_RE.sub(lambda m: _PAUSE_MAP[m.group(0)], text)
     
-    # Generate WAV first
-    wav_path = output_path.replace('.mp3', '_temp.wav')
+    # Pipe espeak WAV output straight into ffmpeg (no temp file on disk)
+    espeak_cmd = [
+        'espeak-ng',
+        '-v', 'en-us',
+        '-s', str(speed),
+        '-p', str(pitch),
+        '-g', str(gap),
+        '-a', '180',  # Amplitude
+        '--stdout',
+        text_with_pauses
+    ]
+    ffmpeg_cmd = [
+        'ffmpeg',
+        '-i', 'pipe:0',
+        '-filter_threads', str(FFMPEG_FILTER_THREADS),
+        '-af', 'bass=g=4,dynaudnorm,acompressor=threshold=-18dB:ratio=4',  # Bass boost + normalize
+        '-codec:a', 'libmp3lame',
+        '-b:a', '192k',
+        '-y',
+        output_path
+    ]
     
     try:
-        subprocess.run([
-            'espeak-ng',
-            '-v', 'en-us',
-            '-s', str(speed),
-            '-p', str(pitch),
-            '-g', str(gap),
-            '-a', '180',  # Amplitude
-            '-w', wav_path,
-            text_with_pauses
-        ], check=True, capture_output=True)
-        
-        # Convert to MP3 with audio enhancements
-        subprocess.run([
-            'ffmpeg',
-            '-i', wav_path,
-            '-af', 'bass=g=4,dynaudnorm,acompressor=threshold=-18dB:ratio=4',  # Bass boost + normalize
-            '-codec:a', 'libmp3lame',
-            '-b:a', '192k',
-            '-y',
-            output_path
-        ], check=True, capture_output=True, stderr=subprocess.DEVNULL)
-        
-        # Clean up temp
-        if os.path.exists(wav_path):
-            os.remove(wav_path)
+        espeak = subprocess.Popen(espeak_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        ffmpeg = subprocess.Popen(ffmpeg_cmd, stdin=espeak.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        espeak.stdout.close()  # Let espeak see SIGPIPE if ffmpeg exits early
+        ffmpeg.communicate()
+        espeak.wait()
+        
+        if espeak.returncode != 0:
+            raise subprocess.CalledProcessError(espeak.returncode, espeak_cmd)
+        if ffmpeg.returncode != 0:
+            raise subprocess.CalledProcessError(ffmpeg.returncode, ffmpeg_cmd)
         
         print(f"✅ espeak generated with enhancements")
         return True
@@ -325,82 +928,173 @@ def generate_audio_espeak(text, output_path, speed_factor=0.80):
         return False
 
 
-def generate_audio_with_fallback(full_text, output_path):
-    """
-    Try Coqui TTS first, then espeak fallback
-    """
-    
+def get_tts_cache_path(full_text, speaker_id, speed, use_sections):
+    """Content-addressed cache entry for everything that determines the primary voiceover"""
+    key = hashlib.sha256(json.dumps({
+        'text': full_text,
+        'speaker': speaker_id,
+        'speed': speed,
+        'model': PRIMARY_MODEL,
+        'sections': use_sections
+    }, sort_keys=True).encode('utf-8')).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+
+
+def store_tts_cache(output_path, cache_path):
+    """Copy a primary-model voiceover into the cache (fallback outputs are never cached)"""
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        shutil.copyfile(output_path, cache_path)
+        
+        # Keep the workflow cache small: drop the oldest voiceovers
+        entries = sorted(
+            (entry for entry in os.scandir(TTS_CACHE_DIR) if entry.name.endswith('.mp3')),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True
+        )
+        for entry in entries[TTS_CACHE_MAX_ENTRIES:]:
+            os.remove(entry.path)
+    except OSError as e:
+        print(f"⚠️ Could not cache voiceover: {e}")
+
+
+def get_voice_settings():
+    """Resolve content type, intensity, speaker and speed from the environment once"""
     content_type = os.getenv('CONTENT_TYPE', 'general')
     intensity = os.getenv('INTENSITY', 'balanced')
     
-    # ✅ Select correct male speaker based on intensity
-    speaker_id = SPEAKER_BY_INTENSITY.get(intensity, 'p326')
+    return {
+        'content_type': content_type,
+        'intensity': intensity,
+        # ✅ Select correct male speaker based on intensity
+        'speaker_id': SPEAKER_BY_INTENSITY.get(intensity, 'p326'),
+        'speed': SPEED_SETTINGS.get(content_type, 0.80)
+    }
+
+
+def generate_audio_with_fallback(full_text, output_path, voice, tts_sections=None):
+    """
+    Try Coqui TTS first, then espeak fallback
+    """
     
-    # Get speed setting
-    speed = SPEED_SETTINGS.get(content_type, 0.80)
+    speaker_id = voice['speaker_id']
+    speed = voice['speed']
     
     print(f"\n🎙️ Generating motivational voiceover...")
-    print(f"   Content: {content_type}")
-    print(f"   Intensity: {intensity}")
+    print(f"   Content: {voice['content_type']}")
+    print(f"   Intensity: {voice['intensity']}")
     print(f"   Speaker: {speaker_id} ({MALE_SPEAKERS[speaker_id]})")
     print(f"   Speed: {speed}x (optimized for 10-15s)")
     
+    if not USE_COQUI:
+        print(f"\n⏭️ Coqui disabled (USE_COQUI=0), using espeak...")
+        return generate_audio_espeak(full_text, output_path, speed)
+    
+    use_sections = bool(tts_sections) and os.getenv('TTS_PARALLEL_SECTIONS', '0') == '1'
+    
+    # Identical text/voice/speed/model was already synthesized - reuse it
+    cache_path = get_tts_cache_path(full_text, speaker_id, speed, use_sections)
+    if is_valid_output(cache_path):
+        shutil.copyfile(cache_path, output_path)
+        os.utime(cache_path)  # most recently used survives pruning
+        print(f"♻️ Reusing cached voiceover: {cache_path}")
+        return True
+    
+    # Opt-in: synthesize sections concurrently
+    if use_sections:
+        if generate_audio_coqui_sections(tts_sections, output_path, speaker_id, speed):
+            store_tts_cache(output_path, cache_path)
+            return True
+        print(f"🔄 Falling back to single-pass synthesis...")
+    
     # Try Coqui TTS (primary)
-    success = generate_audio_coqui(full_text, output_path, speaker_id, speed)
+    success, error = generate_audio_coqui(full_text, output_path, speaker_id, speed)
     
     if success:
+        store_tts_cache(output_path, cache_path)
         return True
     
-    # Try fallback models
+    # Same failure would repeat for every fallback model - go straight to espeak
+    if should_skip_fallback_models(error):
+        print(f"\n🔄 Skipping fallback models ({type(error).__name__}), using espeak...")
+        return generate_audio_espeak(full_text, output_path, speed)
+    
+    # Try fallback models (each loaded at most once per process via get_tts)
     print(f"\n🔄 Trying fallback models...")
     
-    try:
-        from TTS.api import TTS
-        
-        for fallback_model in FALLBACK_MODELS:
-            try:
-                print(f"   Trying: {fallback_model}")
-                tts = TTS(model_name=fallback_model, progress_bar=False)
-                
+    for fallback_model in FALLBACK_MODELS:
+        try:
+            print(f"   Trying: {fallback_model}")
+            tts = get_tts(fallback_model)
+            
+            with inference_context(tts):
                 tts.tts_to_file(
                     text=full_text,
                     file_path=output_path
                 )
+            
+            if is_valid_output(output_path):
+                print(f"   ✅ Fallback success: {fallback_model}")
+                return True
                 
-                if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-                    print(f"   ✅ Fallback success: {fallback_model}")
-                    return True
-                    
-            except Exception as e:
-                print(f"   ⚠️ Failed: {e}")
-                continue
-        
-    except ImportError:
-        print("⚠️ Coqui TTS not available")
+        except ImportError:
+            break
+        except Exception as e:
+            print(f"   ⚠️ Failed: {e}")
+            continue
     
     # Final fallback: espeak
     print(f"\n🔄 Using espeak as final fallback...")
     return generate_audio_espeak(full_text, output_path, speed)
 
 
-def optimize_audio_timing(audio_path, expected_duration, tts_sections):
+_duration_cache = {}
+
+
+def get_audio_duration(audio_path):
     """
-    Optimize audio timing for perfect sync with video
-    
-    Adds section markers for precise synchronization
+    Read audio duration once per file version.
+    Parses the container header in-process with mutagen; falls back to a
+    single ffprobe call. Results are cached by (path, mtime).
     """
+    key = (audio_path, os.path.getmtime(audio_path))
+    if key in _duration_cache:
+        return _duration_cache[key]
     
+    duration = None
     try:
-        # Get actual audio duration
+        import mutagen
+        # mutagen.File sniffs the content (Coqui writes WAV data even to .mp3 paths)
+        audio = mutagen.File(audio_path)
+        if audio is not None and audio.info.length > 0:
+            duration = float(audio.info.length)
+    except Exception:
+        duration = None
+    
+    if duration is None:
         result = subprocess.run([
             'ffprobe',
             '-v', 'error',
             '-show_entries', 'format=duration',
             '-of', 'default=noprint_wrappers=1:nokey=1',
             audio_path
-        ], capture_output=True, text=True, check=True)
-        
-        actual_duration = float(result.stdout.strip())
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+        duration = float(result.stdout.strip())
+    
+    _duration_cache[key] = duration
+    return duration
+
+
+def optimize_audio_timing(audio_path, expected_duration, tts_sections, actual_duration):
+    """
+    Optimize audio timing for perfect sync with video
+    
+    Adds section markers for precise synchronization
+    """
+    
+    try:
+        if actual_duration is None:
+            raise ValueError(f"Could not determine duration of {audio_path}")
         
         print(f"\n⏱️ Audio Timing Analysis:")
         print(f"   Expected: {expected_duration:.2f}s")
@@ -418,59 +1112,48 @@ def optimize_audio_timing(audio_path, expected_duration, tts_sections):
         else:
             print(f"   ✅ Duration within optimal range (10-15s)")
         
-        # Calculate section timings based on word count distribution
-        total_words = sum(len(section['text'].split()) for section in tts_sections)
+        # Calculate section timings: pauses keep their exact length and the
+        # remaining speech time is split by word count, so durations already
+        # sum to the actual duration (no normalization pass needed)
+        word_counts = [section['word_count'] for section in tts_sections]
+        pauses = [section['pause_after'] for section in tts_sections]
+        total_words = sum(word_counts)
+        speech_time = actual_duration - sum(pauses)
         
-        current_time = 0.0
-        section_timings = []
+        if speech_time > 0:
+            durations = [
+                (words / total_words) * speech_time + pause
+                for words, pause in zip(word_counts, pauses)
+            ]
+        else:
+            # Audio shorter than the planned pauses - scale everything proportionally
+            raw = [(words / total_words) * actual_duration + pause for words, pause in zip(word_counts, pauses)]
+            durations = [d * actual_duration / sum(raw) for d in raw]
+        ends = list(accumulate(durations))
         
-        for section in tts_sections:
-            section_words = len(section['text'].split())
-            # Proportional duration based on word count
-            word_duration = (section_words / total_words) * actual_duration
-            # Add pause time
-            pause_duration = section['pause_after']
-            
-            section_duration = word_duration + pause_duration
-            
-            section_timings.append({
+        section_timings = [
+            {
                 'name': section['name'],
-                'start': current_time,
-                'duration': section_duration,
-                'end': current_time + section_duration
-            })
-            
-            current_time += section_duration
-        
-        # Normalize to match actual duration (fix rounding errors)
-        total_calculated = sum(t['duration'] for t in section_timings)
-        adjustment_factor = actual_duration / total_calculated
-        
-        for timing in section_timings:
-            timing['duration'] *= adjustment_factor
-            timing['end'] = timing['start'] + timing['duration']
-        
-        # Recalculate starts
-        current = 0.0
-        for timing in section_timings:
-            timing['start'] = current
-            timing['end'] = current + timing['duration']
-            current = timing['end']
+                'start': end - duration,
+                'duration': duration,
+                'end': end
+            }
+            for section, duration, end in zip(tts_sections, durations, ends)
+        ]
         
         print(f"\n📊 Optimized Section Timings:")
         for timing in section_timings:
             print(f"   {timing['name']}: {timing['start']:.2f}s - {timing['end']:.2f}s ({timing['duration']:.2f}s)")
         
         # Save timing metadata
-        timing_path = os.path.join(TMP, "audio_timing.json")
-        with open(timing_path, 'w') as f:
-            json.dump({
-                'total_duration': actual_duration,
-                'sections': section_timings,
-                'optimized': True,
-                'target_range': '10-15s',
-                'within_target': 9.0 <= actual_duration <= 16.0
-            }, f, indent=2)
+        timing_path = TIMING_FILE
+        write_json(timing_path, {
+            'total_duration': actual_duration,
+            'sections': section_timings,
+            'optimized': True,
+            'target_range': '10-15s',
+            'within_target': 9.0 <= actual_duration <= 16.0
+        })
         
         print(f"\n✅ Timing optimization complete")
         print(f"   Saved to: {timing_path}")
@@ -482,24 +1165,12 @@ def optimize_audio_timing(audio_path, expected_duration, tts_sections):
         return None
 
 
-def save_metadata(audio_path, script_data, full_text, estimated_duration):
+def save_metadata(audio_path, script_data, full_text, estimated_duration, actual_duration, tts_sections):
     """Save audio metadata for video creation"""
     
-    try:
-        # Get actual duration
-        result = subprocess.run([
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            audio_path
-        ], capture_output=True, text=True, check=True)
-        
-        duration = float(result.stdout.strip())
-    except:
-        duration = estimated_duration
+    duration = actual_duration if actual_duration is not None else estimated_duration
     
-    word_count = len(full_text.split())
+    word_count = sum(section['word_count'] for section in tts_sections)
     wpm = (word_count / duration) * 60 if duration > 0 else 0
     
     # ✅ MODIFIED: Enhanced metadata with target compliance tracking
@@ -509,7 +1180,7 @@ def save_metadata(audio_path, script_data, full_text, estimated_duration):
         'word_count': word_count,
         'character_count': len(full_text),
         'wpm': round(wpm, 1),
-        'pause_count': full_text.count('...'),
+        'pause_count': sum(section['pause_count'] for section in tts_sections),
         'content_type': script_data.get('content_type', 'general'),
         'intensity': script_data.get('intensity', 'balanced'),
         'speaker': SPEAKER_BY_INTENSITY.get(script_data.get('intensity', 'balanced'), 'p326'),
@@ -522,21 +1193,32 @@ def save_metadata(audio_path, script_data, full_text, estimated_duration):
         'speed_setting': SPEED_SETTINGS.get(script_data.get('content_type', 'general'), 0.80)
     }
     
-    metadata_path = os.path.join(TMP, "audio_metadata.json")
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    metadata_path = METADATA_FILE
+    write_json(metadata_path, metadata)
     
-    print(f"\n📊 Audio Metadata:")
-    print(f"   Duration: {duration:.2f}s")
-    print(f"   Target: 10-15s")
-    print(f"   Within target: {'✅ YES' if metadata['within_target'] else '⚠️ NO'}")
-    print(f"   Words: {word_count}")
-    print(f"   WPM: {wpm:.1f}")
-    print(f"   File: {audio_path} ({os.path.getsize(audio_path) / 1024:.1f} KB)")
-    print(f"   Model: {metadata['model']}")
-    print(f"   Speaker: {metadata['speaker']}")
-    print(f"   Speed: {metadata['speed_setting']}x")
-    print(f"   ✅ Metadata: {metadata_path}")
+    # Single print so the block stays intact when run alongside timing analysis
+    print("\n".join([
+        f"\n📊 Audio Metadata:",
+        f"   Duration: {duration:.2f}s",
+        f"   Target: 10-15s",
+        f"   Within target: {'✅ YES' if metadata['within_target'] else '⚠️ NO'}",
+        f"   Words: {word_count}",
+        f"   WPM: {wpm:.1f}",
+        f"   File: {audio_path} ({os.path.getsize(audio_path) / 1024:.1f} KB)",
+        f"   Model: {metadata['model']}",
+        f"   Speaker: {metadata['speaker']}",
+        f"   Speed: {metadata['speed_setting']}x",
+        f"   ✅ Metadata: {metadata_path}",
+    ]))
+
+
+async def write_audio_reports(audio_path, script_data, full_text, estimated_duration, actual_duration, tts_sections):
+    """Write audio_timing.json and audio_metadata.json concurrently"""
+    section_timings, _ = await asyncio.gather(
+        asyncio.to_thread(optimize_audio_timing, audio_path, estimated_duration, tts_sections, actual_duration),
+        asyncio.to_thread(save_metadata, audio_path, script_data, full_text, estimated_duration, actual_duration, tts_sections)
+    )
+    return section_timings
 
 
 def main():
@@ -547,7 +1229,11 @@ def main():
     print("="*70)
     
     # Load script
-    script_data = load_script()
+    try:
+        script_data = load_script()
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
     
     print(f"📝 Script: {script_data['title']}")
     print(f"🎯 Content Type: {script_data.get('content_type', 'general')}")
@@ -564,20 +1250,29 @@ def main():
     print(f"   Preview: {full_text[:100]}...")
     
     # Output path
-    output_path = os.path.join(TMP, "voice.mp3")
+    output_path = VOICE_FILE
+    
+    # Voice settings are resolved once and shared by every synthesis path
+    voice = get_voice_settings()
     
     # Generate audio
-    success = generate_audio_with_fallback(full_text, output_path)
+    success = generate_audio_with_fallback(full_text, output_path, voice, tts_sections)
     
     if not success or not os.path.exists(output_path):
         print("\n❌ All TTS methods failed!")
         exit(1)
     
-    # Optimize timing for video sync
-    section_timings = optimize_audio_timing(output_path, estimated_duration, tts_sections)
+    # Probe the rendered audio once and share the duration
+    try:
+        actual_duration = get_audio_duration(output_path)
+    except Exception as e:
+        print(f"⚠️ Could not read audio duration: {e}")
+        actual_duration = None
     
-    # Save metadata
-    save_metadata(output_path, script_data, full_text, estimated_duration)
+    # Optimize timing for video sync and save metadata (independent writes)
+    section_timings = asyncio.run(write_audio_reports(
+        output_path, script_data, full_text, estimated_duration, actual_duration, tts_sections
+    ))
     
     print("\n" + "="*70)
     print("✅ VOICEOVER GENERATION COMPLETE!")
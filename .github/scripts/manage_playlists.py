@@ -15,14 +15,51 @@ from datetime import datetime
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
-from collections import defaultdict
+from collections import Counter, defaultdict
 import re
 import difflib
 import time
+from functools import lru_cache, partial
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 TMP = os.getenv("GITHUB_WORKSPACE", ".") + "/tmp"
 PLAYLIST_CONFIG_FILE = os.path.join(TMP, "playlist_config.json")
 UPLOAD_LOG = os.path.join(TMP, "upload_history.json")
+PLAYLIST_MEMBERS_CACHE_FILE = os.path.join(TMP, "playlist_members_cache.json")
+VIDEO_CATEGORY_CACHE_FILE = os.path.join(TMP, "video_category_cache.json")
+
+# Transient-error retries (5xx/429, exponential backoff) handled by googleapiclient.
+# Read-only calls only: a retried insert that had already landed adds a duplicate.
+API_NUM_RETRIES = 3
+
+# Max calls per HTTP batch request (YouTube Data API limit)
+BATCH_SIZE = 50
+
+# Emoji/punctuation stripped before comparing playlist titles
+_TITLE_STRIP_RE = re.compile(r'[^\w\s]+')
+
+# Categorize across processes once there are enough uncached videos to pay for the pool
+CATEGORIZE_WORKERS = int(os.getenv("PLAYLIST_CATEGORIZE_WORKERS", os.cpu_count() or 1))
+PARALLEL_CATEGORIZE_MIN = 64
 
 
 def get_youtube_client():
@@ -36,7 +73,7 @@ def get_youtube_client():
             client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
             scopes=["https://www.googleapis.com/auth/youtube"]
         )
-        youtube = build("youtube", "v3", credentials=creds, cache_discovery=False)
+        youtube = build("youtube", "v3", credentials=creds, cache_discovery=False, static_discovery=True)
         print("✅ YouTube API authenticated")
         return youtube
     except Exception as e:
@@ -113,6 +150,110 @@ PLAYLIST_RULES = {
 }
 
 
+@lru_cache(maxsize=4096)
+def normalize_title(title):
+    """Lowercase a title and drop emojis, punctuation and extra whitespace"""
+    return " ".join(_TITLE_STRIP_RE.sub("", title).lower().split())
+
+
+def find_similar_title(title, candidates, threshold=0.6):
+    """Best candidate title whose similarity ratio exceeds threshold (None if none do)"""
+    if RAPIDFUZZ_AVAILABLE:
+        match = process.extractOne(title, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100)
+        return match[0] if match else None
+    
+    for candidate in candidates:
+        if difflib.SequenceMatcher(None, title, candidate).ratio() > threshold:
+            return candidate
+    return None
+
+
+def count_fuzzy_matches(words, text_words, threshold=0.85):
+    """For each word, the number of text words whose similarity ratio exceeds threshold"""
+    if not words or not text_words:
+        return dict.fromkeys(words, 0)
+    
+    if RAPIDFUZZ_AVAILABLE:
+        cutoff = threshold * 100
+        # One native words x text_words similarity matrix (scores under the cutoff come back as 0)
+        matrix = process.cdist(words, text_words, scorer=fuzz.ratio, score_cutoff=cutoff)
+        return dict(zip(words, (matrix > cutoff).sum(axis=1).tolist()))
+    
+    return {
+        word: sum(
+            1 for text_word in text_words
+            if difflib.SequenceMatcher(None, word, text_word).ratio() > threshold
+        )
+        for word in words
+    }
+
+
+# Bonus phrases per category (scored on top of keyword matches)
+POWER_PHRASES = {
+    "morning_fire": ["wake up", "5 am", "morning routine", "start your day"],
+    "discipline": ["hard work", "no excuses", "grind", "discipline"],
+    "mindset": ["mental", "mindset", "believe", "think"],
+    "late_night": ["2 am", "late night", "can't sleep", "scrolling"],
+    "success": ["success", "transformation", "winner", "achieved"]
+}
+
+
+@lru_cache(maxsize=None)
+def get_category_matchers(niche):
+    """
+    Lowercased keywords, their words and power phrases per category,
+    derived from PLAYLIST_RULES once per niche instead of on every video.
+    """
+    return {
+        category: {
+            "keywords": tuple(kw.lower() for kw in rules["keywords"]),
+            # Keyword words with multiplicity: >3 chars can hit exactly, the rest only fuzzily
+            "long_words": Counter(w for kw in rules["keywords"] for w in kw.lower().split() if len(w) > 3),
+            "short_words": Counter(w for kw in rules["keywords"] for w in kw.lower().split() if len(w) <= 3),
+            "power_phrases": tuple(POWER_PHRASES.get(category, ()))
+        }
+        for category, rules in PLAYLIST_RULES[niche].items()
+    }
+
+
+@lru_cache(maxsize=None)
+def get_keyword_words(niche):
+    """All distinct keyword words of a niche: (long words that can hit exactly, short words)"""
+    matchers = get_category_matchers(niche).values()
+    return (
+        frozenset(chain.from_iterable(m["long_words"] for m in matchers)),
+        frozenset(chain.from_iterable(m["short_words"] for m in matchers))
+    )
+
+
+@lru_cache(maxsize=None)
+def get_keyword_patterns(niche):
+    """Every substring categorize_video looks for in a niche (keywords, keyword words, power phrases)"""
+    patterns = set()
+    for matcher in get_category_matchers(niche).values():
+        patterns.update(matcher["keywords"])
+        patterns.update(matcher["long_words"])
+        patterns.update(matcher["power_phrases"])
+    return frozenset(patterns)
+
+
+@lru_cache(maxsize=None)
+def get_keyword_automaton(niche):
+    """Aho-Corasick automaton over a niche's patterns, built once per niche"""
+    automaton = ahocorasick.Automaton()
+    for pattern in get_keyword_patterns(niche):
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_keyword_patterns(text, niche):
+    """Set of the niche's patterns that occur in text (one pass with Aho-Corasick)"""
+    if AHOCORASICK_AVAILABLE:
+        return {pattern for _, pattern in get_keyword_automaton(niche).iter(text)}
+    return {pattern for pattern in get_keyword_patterns(niche) if pattern in text}
+
+
 def fetch_and_map_existing_playlists(youtube, niche, config):
     """Fetch existing playlists and map to categories"""
     print("🔄 Fetching existing playlists...")
@@ -124,8 +265,9 @@ def fetch_and_map_existing_playlists(youtube, niche, config):
             part="snippet",
             mine=True,
             maxResults=50,
-            pageToken=nextPageToken
-        ).execute()
+            pageToken=nextPageToken,
+            fields="nextPageToken,items(id,snippet/title)"
+        ).execute(num_retries=API_NUM_RETRIES)
         
         for item in response.get("items", []):
             existing_playlists[item["snippet"]["title"].lower()] = item["id"]
@@ -134,16 +276,17 @@ def fetch_and_map_existing_playlists(youtube, niche, config):
         if not nextPageToken:
             break
     
-    # Map to categories using fuzzy matching
+    # Normalized title -> ID for exact matches (the usual case)
+    normalized_playlists = {normalize_title(title): pid for title, pid in existing_playlists.items()}
+    
+    # Map to categories: exact normalized match first, fuzzy matching otherwise
     for category, rules in PLAYLIST_RULES[niche].items():
         key = f"{niche}_{category}"
-        match = None
+        match = normalized_playlists.get(normalize_title(rules["title"]))
         
-        for title, pid in existing_playlists.items():
-            ratio = difflib.SequenceMatcher(None, rules["title"].lower(), title).ratio()
-            if ratio > 0.6:
-                match = pid
-                break
+        if not match:
+            title = find_similar_title(rules["title"].lower(), list(existing_playlists))
+            match = existing_playlists[title] if title else None
         
         if match:
             if key in config and config[key] != match:
@@ -155,12 +298,31 @@ def fetch_and_map_existing_playlists(youtube, niche, config):
     return config
 
 
+def read_json(path):
+    """Parse a JSON file from one binary read (orjson when installed)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def write_json(path, obj, indent=False):
+    """Write JSON atomically (temp file + rename) so a killed run never leaves a truncated file"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        payload = json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+    
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
 def load_upload_history():
     """Load video upload history"""
     if os.path.exists(UPLOAD_LOG):
         try:
-            with open(UPLOAD_LOG, 'r') as f:
-                return json.load(f)
+            return read_json(UPLOAD_LOG)
         except:
             return []
     return []
@@ -170,8 +332,7 @@ def load_playlist_config():
     """Load playlist configuration"""
     if os.path.exists(PLAYLIST_CONFIG_FILE):
         try:
-            with open(PLAYLIST_CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(PLAYLIST_CONFIG_FILE)
         except:
             return {}
     return {}
@@ -179,11 +340,20 @@ def load_playlist_config():
 
 def save_playlist_config(config):
     """Save playlist configuration"""
-    with open(PLAYLIST_CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_json(PLAYLIST_CONFIG_FILE, config, indent=True)
     print(f"💾 Saved playlist config: {len(config)} playlists")
 
 
+def load_json_cache(path):
+    """Load a JSON cache file (empty dict if missing or unreadable)"""
+    if os.path.exists(path):
+        try:
+            return read_json(path)
+        except:
+            return {}
+    return {}
+
+
 def get_or_create_playlist(youtube, niche, category, config):
     """Get existing playlist or create new one"""
     playlist_key = f"{niche}_{category}"
@@ -215,7 +385,6 @@ def get_or_create_playlist(youtube, niche, category, config):
         playlist_id = response["id"]
         
         config[playlist_key] = playlist_id
-        save_playlist_config(config)
         print(f"🎉 Created playlist: {title}")
         return playlist_id
         
@@ -224,92 +393,116 @@ def get_or_create_playlist(youtube, niche, category, config):
         return None
 
 
-def categorize_video(video_metadata, niche):
+def get_video_text(video_metadata):
+    """Lowercased searchable text of a video, built once and kept on the video dict"""
+    text = video_metadata.get("_text_lower")
+    if text is None:
+        text = video_metadata["_text_lower"] = " ".join(chain(
+            (
+                video_metadata.get("title", ""),
+                video_metadata.get("description", ""),
+                video_metadata.get("hook", ""),
+                video_metadata.get("key_phrase", "")
+            ),
+            video_metadata.get("hashtags", [])
+        )).lower()
+    return text
+
+
+def categorize_video(video_metadata, niche, verbose=True):
     """Smart categorization using keyword matching"""
-    text = " ".join([
-        video_metadata.get("title", ""),
-        video_metadata.get("description", ""),
-        video_metadata.get("hook", ""),
-        video_metadata.get("key_phrase", ""),
-        " ".join(video_metadata.get("hashtags", []))
-    ]).lower()
+    # Category chosen upstream (e.g. at generation time) wins outright
+    hint = video_metadata.get("playlist_category")
+    if hint and hint in PLAYLIST_RULES.get(niche, {}):
+        if verbose:
+            print(f"   📂 Hinted category: {hint}")
+        return hint
+    
+    text = get_video_text(video_metadata)
     
     if niche not in PLAYLIST_RULES:
         return None
     
+    # Candidate words for fuzzy matching, split once per video
+    text_words = [w for w in text.split() if len(w) > 3]
+    
+    # Every keyword/phrase present in the text, found in a single scan
+    found = find_keyword_patterns(text, niche)
+    
+    # Fuzzy match counts for every keyword word without an exact hit, in one pass
+    long_words_all, short_words_all = get_keyword_words(niche)
+    fuzzy_counts = count_fuzzy_matches(sorted((long_words_all - found) | short_words_all), text_words)
+    
     scores = {}
-    for category, rules in PLAYLIST_RULES[niche].items():
-        score = 0
-        
+    for category, matcher in get_category_matchers(niche).items():
         # Exact keyword matches
-        for kw in rules["keywords"]:
-            kw_lower = kw.lower()
-            if kw_lower in text:
-                score += 5
-            
-            # Partial matches
-            for word in kw_lower.split():
-                if len(word) > 3 and word in text:
-                    score += 2
-                else:
-                    # Fuzzy matching
-                    for text_word in text.split():
-                        if len(text_word) > 3:
-                            ratio = difflib.SequenceMatcher(None, word, text_word).ratio()
-                            if ratio > 0.85:
-                                score += 1
+        score = 5 * sum(1 for kw in matcher["keywords"] if kw in found)
         
-        # Bonus for power phrases
-        power_phrases = {
-            "morning_fire": ["wake up", "5 am", "morning routine", "start your day"],
-            "discipline": ["hard work", "no excuses", "grind", "discipline"],
-            "mindset": ["mental", "mindset", "believe", "think"],
-            "late_night": ["2 am", "late night", "can't sleep", "scrolling"],
-            "success": ["success", "transformation", "winner", "achieved"]
-        }
+        # Partial matches (one set intersection against the words found in the text)
+        long_words = matcher["long_words"]
+        hits = long_words.keys() & found
+        score += 2 * sum(long_words[word] for word in hits)
+        
+        # Fuzzy matching for every other keyword word
+        misses = chain(
+            ((word, n) for word, n in long_words.items() if word not in hits),
+            matcher["short_words"].items()
+        )
+        score += sum(n * fuzzy_counts[word] for word, n in misses)
         
-        if category in power_phrases:
-            for phrase in power_phrases[category]:
-                if phrase in text:
-                    score += 3
+        # Bonus for power phrases
+        score += 3 * sum(1 for phrase in matcher["power_phrases"] if phrase in found)
         
         if score > 0:
             scores[category] = score
     
     if scores:
         best = max(scores, key=scores.get)
-        print(f"   📂 Categorized as: {best} (score: {scores[best]})")
+        if verbose:
+            print(f"   📂 Categorized as: {best} (score: {scores[best]})")
         return best
     
-    print("   ⚠️ No match, defaulting to 'discipline'")
+    if verbose:
+        print("   ⚠️ No match, defaulting to 'discipline'")
     return "discipline"
 
 
-def add_video_to_playlist(youtube, video_id, playlist_id):
-    """Add video to playlist with retry logic"""
+def categorize_videos(videos, niche):
+    """Categorize many videos, in worker processes when the batch is large enough"""
+    if len(videos) < PARALLEL_CATEGORIZE_MIN or CATEGORIZE_WORKERS <= 1:
+        return [categorize_video(video, niche, verbose=False) for video in videos]
     
-    # Check if already in playlist
-    existing_videos = set()
+    print(f"⚡ Categorizing {len(videos)} videos across {CATEGORIZE_WORKERS} processes...")
+    with ProcessPoolExecutor(max_workers=CATEGORIZE_WORKERS) as executor:
+        return list(executor.map(
+            partial(categorize_video, niche=niche, verbose=False), videos, chunksize=32
+        ))
+
+
+def fetch_playlist_video_ids(youtube, playlist_id):
+    """Fetch the set of video IDs already in a playlist (None if it can't be read)"""
     max_retries = 3
     
     for attempt in range(max_retries):
         try:
+            existing_videos = set()
             nextPageToken = None
             while True:
                 response = youtube.playlistItems().list(
-                    part="snippet",
+                    part="contentDetails",
                     playlistId=playlist_id,
                     maxResults=50,
-                    pageToken=nextPageToken
-                ).execute()
+                    pageToken=nextPageToken,
+                    fields="nextPageToken,items/contentDetails/videoId"
+                ).execute(num_retries=API_NUM_RETRIES)
                 
                 for item in response.get("items", []):
-                    existing_videos.add(item["snippet"]["resourceId"]["videoId"])
+                    existing_videos.add(item["contentDetails"]["videoId"])
                 
                 nextPageToken = response.get("nextPageToken")
                 if not nextPageToken:
                     break
-            break
+            return existing_videos
             
         except HttpError as e:
             if e.resp.status == 404 and attempt < max_retries - 1:
@@ -320,7 +513,41 @@ def add_video_to_playlist(youtube, video_id, playlist_id):
                 print(f"      ⚠️ Could not check playlist: {e}")
                 break
     
-    if video_id in existing_videos:
+    return None
+
+
+def get_playlist_members(youtube, playlist_id, playlist_members):
+    """
+    Video IDs already in a playlist (None if it can't be listed).
+    playlist_members caches each playlist's video IDs so a playlist is
+    listed once per run instead of once per video.
+    """
+    existing_videos = playlist_members.get(playlist_id)
+    if existing_videos is None:
+        existing_videos = fetch_playlist_video_ids(youtube, playlist_id)
+        if existing_videos is not None:
+            playlist_members[playlist_id] = existing_videos
+    return existing_videos
+
+
+def playlist_item_body(playlist_id, video_id):
+    """playlistItems.insert body for a video"""
+    return {
+        "snippet": {
+            "playlistId": playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": video_id}
+        }
+    }
+
+
+def add_video_to_playlist(youtube, video_id, playlist_id, playlist_members):
+    """Add video to playlist with retry logic"""
+    max_retries = 3
+    
+    # Check if already in playlist
+    existing_videos = get_playlist_members(youtube, playlist_id, playlist_members)
+    
+    if existing_videos and video_id in existing_videos:
         print("      ℹ️ Already in playlist")
         return False
     
@@ -329,13 +556,10 @@ def add_video_to_playlist(youtube, video_id, playlist_id):
         try:
             youtube.playlistItems().insert(
                 part="snippet",
-                body={
-                    "snippet": {
-                        "playlistId": playlist_id,
-                        "resourceId": {"kind": "youtube#video", "videoId": video_id}
-                    }
-                }
+                body=playlist_item_body(playlist_id, video_id)
             ).execute()
+            if existing_videos is not None:
+                existing_videos.add(video_id)
             print("      ✅ Added to playlist")
             return True
             
@@ -351,6 +575,69 @@ def add_video_to_playlist(youtube, video_id, playlist_id):
     return False
 
 
+def add_videos_batched(youtube, pending, playlist_members):
+    """
+    Insert (playlist_id, video_id) pairs, BATCH_SIZE per HTTP round trip.
+    Returns the pairs that failed so they can be retried one by one.
+    """
+    failed = []
+    
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[start:start + BATCH_SIZE]
+        errors = {}
+        
+        def on_insert_done(request_id, response, exception):
+            errors[request_id] = exception
+        
+        batch = youtube.new_batch_http_request(callback=on_insert_done)
+        for idx, (playlist_id, video_id) in enumerate(chunk):
+            batch.add(
+                youtube.playlistItems().insert(
+                    part="snippet",
+                    body=playlist_item_body(playlist_id, video_id)
+                ),
+                request_id=str(idx)
+            )
+        
+        try:
+            batch.execute()
+        except Exception as e:
+            # Part of the chunk may have gone through before the batch failed:
+            # forget those playlists' members so they are listed again
+            for playlist_id, _ in chunk:
+                playlist_members.pop(playlist_id, None)
+            if not isinstance(e, HttpError):
+                raise
+            print(f"   ⚠️ Batch insert failed: {e}")
+            failed.extend(chunk)
+            continue
+        
+        added = 0
+        for idx, (playlist_id, video_id) in enumerate(chunk):
+            if str(idx) in errors and errors[str(idx)] is None:
+                added += 1
+                existing_videos = playlist_members.get(playlist_id)
+                if existing_videos is not None:
+                    existing_videos.add(video_id)
+            else:
+                failed.append((playlist_id, video_id))
+        
+        print(f"   ✅ Batch added {added}/{len(chunk)} videos")
+    
+    return failed
+
+
+def save_playlist_caches(category_cache, playlist_members):
+    """Persist the video category and playlist membership caches"""
+    try:
+        write_json(VIDEO_CATEGORY_CACHE_FILE, category_cache)
+        write_json(PLAYLIST_MEMBERS_CACHE_FILE, {
+            pid: sorted(video_ids) for pid, video_ids in playlist_members.items()
+        })
+    except OSError as e:
+        print(f"⚠️ Could not save playlist caches: {e}")
+
+
 def organize_playlists(youtube, history, config, niche):
     """Main organization function"""
     print(f"\n🎬 Organizing {len(history)} videos into playlists...")
@@ -363,38 +650,88 @@ def organize_playlists(youtube, history, config, niche):
         "failed": 0
     }
     
-    for video in history:
-        video_id = video.get("video_id")
-        title = video.get("title", "Unknown")
-        
-        if not video_id:
-            continue
-        
-        print(f"\n📹 Processing: {title}")
-        
-        # Categorize
-        category = categorize_video(video, niche)
-        
-        if not category:
-            stats["failed"] += 1
-            continue
+    # playlist_id -> video IDs already in it (listed once per playlist,
+    # persisted across runs so known playlists skip the scan entirely)
+    playlist_members = {
+        pid: set(video_ids)
+        for pid, video_ids in load_json_cache(PLAYLIST_MEMBERS_CACHE_FILE).items()
+    }
+    
+    # video_id -> {"niche", "category"}; only uncached videos are re-scored
+    category_cache = load_json_cache(VIDEO_CATEGORY_CACHE_FILE)
+    
+    # Caches are saved even if the run dies midway, so inserts that already
+    # went through are not repeated (as duplicates) by the next run
+    try:
+        # Score every uncached video up front (CPU-bound, parallel for large histories)
+        uncached = {}
+        for video in history:
+            video_id = video.get("video_id")
+            cached = category_cache.get(video_id)
+            if video_id and not (cached and cached.get("niche") == niche):
+                uncached.setdefault(video_id, video)
         
-        stats["categorized"] += 1
+        for video_id, category in zip(uncached, categorize_videos(list(uncached.values()), niche)):
+            if category:
+                category_cache[video_id] = {"niche": niche, "category": category}
         
-        # Get/create playlist
-        playlist_id = get_or_create_playlist(youtube, niche, category, config)
+        # (playlist_id, video_id) pairs to insert once every video is categorized
+        pending = []
+        queued = set()
         
-        if not playlist_id:
-            stats["failed"] += 1
-            continue
+        for video in history:
+            video_id = video.get("video_id")
+            title = video.get("title", "Unknown")
+            
+            if not video_id:
+                continue
+            
+            print(f"\n📹 Processing: {title}")
+            
+            # Category from the up-front pass (or a previous run's cache)
+            cached = category_cache.get(video_id)
+            category = cached["category"] if cached and cached.get("niche") == niche else None
+            
+            if not category:
+                stats["failed"] += 1
+                continue
+            
+            print(f"   📂 Category: {category}{'' if video_id in uncached else ' (cached)'}")
+            stats["categorized"] += 1
+            
+            # Get/create playlist
+            playlist_id = get_or_create_playlist(youtube, niche, category, config)
+            
+            if not playlist_id:
+                stats["failed"] += 1
+                continue
+            
+            # Queue for batched insert unless it's already there
+            existing_videos = get_playlist_members(youtube, playlist_id, playlist_members)
+            if existing_videos and video_id in existing_videos:
+                print("      ℹ️ Already in playlist")
+                stats["already_in_playlists"] += 1
+            elif (playlist_id, video_id) in queued:
+                stats["already_in_playlists"] += 1
+            else:
+                queued.add((playlist_id, video_id))
+                pending.append((playlist_id, video_id))
         
-        # Add to playlist
-        success = add_video_to_playlist(youtube, video_id, playlist_id)
+        # Add queued videos in batches, then retry failures one at a time
+        if pending:
+            print(f"\n📥 Adding {len(pending)} videos to playlists...")
+            failed = add_videos_batched(youtube, pending, playlist_members)
+            stats["added_to_playlists"] += len(pending) - len(failed)
+            
+            for playlist_id, video_id in failed:
+                print(f"\n🔁 Retrying: {video_id}")
+                if add_video_to_playlist(youtube, video_id, playlist_id, playlist_members):
+                    stats["added_to_playlists"] += 1
+                else:
+                    stats["already_in_playlists"] += 1
         
-        if success:
-            stats["added_to_playlists"] += 1
-        else:
-            stats["already_in_playlists"] += 1
+    finally:
+        save_playlist_caches(category_cache, playlist_members)
     
     return stats
 
@@ -433,6 +770,13 @@ if __name__ == "__main__":
     history = load_upload_history()
     config = load_playlist_config()
     
+    # One entry per video (re-uploads/retries repeat IDs); entries without an ID are skipped anyway
+    seen_ids = set()
+    history = [
+        video for video in history
+        if video.get("video_id") and not (video["video_id"] in seen_ids or seen_ids.add(video["video_id"]))
+    ]
+    
     if not history:
         print("⚠️ No upload history. Upload videos first!")
         exit(0)
@@ -446,8 +790,11 @@ if __name__ == "__main__":
     config = fetch_and_map_existing_playlists(youtube, niche, config)
     save_playlist_config(config)
     
-    # Organize
-    stats = organize_playlists(youtube, history, config, niche)
+    # Organize (new playlist IDs are saved once at the end, even if it fails midway)
+    try:
+        stats = organize_playlists(youtube, history, config, niche)
+    finally:
+        save_playlist_config(config)
     
     # Results
     print("\n" + "="*70)
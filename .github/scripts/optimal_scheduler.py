@@ -9,11 +9,25 @@ import os
 import json
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
+from bisect import bisect_right
 import pytz
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # MASTER SCHEDULE - Now supports BOTH EST and WAT
 TIMEZONE = os.getenv("SCHEDULER_TIMEZONE", "US/Eastern")  # EST/EDT by default
 
+# Run settings, read from the environment once
+IGNORE_SCHEDULE = os.getenv("IGNORE_SCHEDULE", "false").lower() == "true"
+GITHUB_OUTPUT = os.getenv("GITHUB_OUTPUT")
+# Human-readable summary only for terminals (CI prints the decision/JSON itself) or LOG_SUMMARY=1
+LOG_SUMMARY = sys.stdout.isatty() or os.getenv("LOG_SUMMARY") == "1"
+
 # Motivation content performs best at these times:
 OPTIMAL_SCHEDULE = {
     # Every day (Monday=0 to Sunday=6) focuses on the same two powerful slots.
@@ -29,6 +43,8 @@ OPTIMAL_SCHEDULE = {
     6: {"times": [7, 22], "content_types": ["sunday_motivation", "week_prep"], "priority": ["highest", "extreme"]},
 }
 
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
 # Content pillar mapping
 CONTENT_PILLARS = {
     # Morning Ignition Pillars (for the 7 AM slot)
@@ -65,10 +81,34 @@ CONTENT_PILLARS = {
     }
 }
 
+def build_slot_table():
+    """Hour-of-week lookup table: table[weekday][hour] -> (priority, content_type) or None"""
+    table = [[None] * 24 for _ in range(7)]
+    for weekday, config in OPTIMAL_SCHEDULE.items():
+        for hour, content_type, priority in zip(config["times"], config["content_types"], config["priority"]):
+            table[weekday][hour] = (priority, content_type)
+    return table
+
+SLOT_TABLE = build_slot_table()
+
+def build_slots_by_day():
+    """Per weekday: (sorted hours, matching (hour, content_type, priority) slots) for bisect lookups"""
+    slots_by_day = {}
+    for weekday, config in OPTIMAL_SCHEDULE.items():
+        slots = sorted(zip(config["times"], config["content_types"], config["priority"]))
+        slots_by_day[weekday] = ([slot[0] for slot in slots], slots)
+    return slots_by_day
+
+SLOTS_BY_DAY = build_slots_by_day()
+
+@lru_cache(maxsize=8)
+def get_timezone(tz_name):
+    """pytz timezone object, loaded once per name"""
+    return pytz.timezone(tz_name)
+
 def get_current_time(tz_name=TIMEZONE):
     """Get current time in specified timezone"""
-    tz = pytz.timezone(tz_name)
-    return datetime.now(tz)
+    return datetime.now(get_timezone(tz_name))
 
 def should_post_now(ignore_schedule=False):
     """Determine if current time is optimal for posting"""
@@ -79,68 +119,72 @@ def should_post_now(ignore_schedule=False):
     if ignore_schedule:
         return True, "manual", "user_triggered", current
     
-    if weekday not in OPTIMAL_SCHEDULE:
-        return False, "low", "off_schedule", current
-    
-    schedule = OPTIMAL_SCHEDULE[weekday]
-    times = schedule["times"]
-    
-    # Check if within 30 minutes of optimal time
-    for idx, optimal_hour in enumerate(times):
-        time_diff = abs(hour - optimal_hour)
-        if time_diff <= 0.5:  # Within 30 minutes
-            content_type = schedule["content_types"][idx]
-            priority = schedule["priority"][idx]
-            return True, priority, content_type, current
+    # Optimal hour of an optimal day (hour is whole, so this is the 30-minute window check)
+    slot = SLOT_TABLE[weekday][hour]
+    if slot:
+        priority, content_type = slot
+        return True, priority, content_type, current
     
     return False, "low", "off_schedule", current
 
-def get_next_optimal_slot():
-    """Get the next optimal posting time"""
-    current = get_current_time()
+def get_next_optimal_slot(current=None):
+    """Get the next optimal posting time (after current, default now)"""
+    if current is None:
+        current = get_current_time()
     
-    # Check all upcoming slots in the next 7 days
-    for day_offset in range(7):
+    # First slot after now: later today, else the earliest slot of the next scheduled day
+    # (8 days so a single weekly slot that already passed today is found next week)
+    for day_offset in range(8):
         check_date = current + timedelta(days=day_offset)
         weekday = check_date.weekday()
         
-        if weekday not in OPTIMAL_SCHEDULE:
+        if weekday not in SLOTS_BY_DAY:
             continue
         
-        schedule = OPTIMAL_SCHEDULE[weekday]
-        for idx, hour in enumerate(schedule["times"]):
-            slot_time = check_date.replace(hour=hour, minute=0, second=0, microsecond=0)
-            
-            if slot_time > current:
-                return {
-                    "time": slot_time.strftime("%A %I:%M %p"),
-                    "datetime": slot_time.isoformat(),
-                    "content_type": schedule["content_types"][idx],
-                    "priority": schedule["priority"][idx],
-                    "day_name": slot_time.strftime("%A"),
-                    "time_only": slot_time.strftime("%I:%M %p"),
-                    "pillar": CONTENT_PILLARS.get(schedule["content_types"][idx], {})
-                }
+        hours, slots = SLOTS_BY_DAY[weekday]
+        idx = bisect_right(hours, current.hour) if day_offset == 0 else 0
+        if idx == len(slots):
+            continue
+        
+        hour, content_type, priority = slots[idx]
+        slot_time = check_date.replace(hour=hour, minute=0, second=0, microsecond=0)
+        return {
+            "time": slot_time.strftime("%A %I:%M %p"),
+            "datetime": slot_time.isoformat(),
+            "content_type": content_type,
+            "priority": priority,
+            "day_name": slot_time.strftime("%A"),
+            "time_only": slot_time.strftime("%I:%M %p"),
+            "pillar": CONTENT_PILLARS.get(content_type, {})
+        }
     
     return None
 
+@lru_cache(maxsize=1)
 def generate_weekly_schedule():
-    """Generate full week's posting schedule"""
+    """Generate full week's posting schedule (built once; callers only read it)"""
     schedule = {}
     
+    # Identical (hour, content_type, priority) slots share one dict across days
+    slot_cache = {}
+    
     for weekday, config in OPTIMAL_SCHEDULE.items():
-        day_name = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][weekday]
+        day_name = DAY_NAMES[weekday]
         slots = []
         
-        for idx, hour in enumerate(config["times"]):
-            content_type = config["content_types"][idx]
-            slots.append({
-                "time": f"{hour:02d}:00",
-                "content_type": content_type,
-                "priority": config["priority"][idx],
-                "pillar": CONTENT_PILLARS.get(content_type, {}),
-                "keywords": CONTENT_PILLARS.get(content_type, {}).get("keywords", [])
-            })
+        for hour, content_type, priority in zip(config["times"], config["content_types"], config["priority"]):
+            key = (hour, content_type, priority)
+            slot = slot_cache.get(key)
+            if slot is None:
+                pillar = CONTENT_PILLARS.get(content_type, {})
+                slot = slot_cache[key] = {
+                    "time": f"{hour:02d}:00",
+                    "content_type": content_type,
+                    "priority": priority,
+                    "pillar": pillar,
+                    "keywords": pillar.get("keywords", [])
+                }
+            slots.append(slot)
         
         schedule[day_name] = slots
     
@@ -148,13 +192,14 @@ def generate_weekly_schedule():
 
 def main():
     """Main scheduler logic"""
-    # Check if ignore_schedule flag is set
-    ignore_schedule = os.getenv("IGNORE_SCHEDULE", "false").lower() == "true"
-    
-    should_post, priority, content_type, current_time = should_post_now(ignore_schedule)
-    next_slot = get_next_optimal_slot()
+    should_post, priority, content_type, current_time = should_post_now(IGNORE_SCHEDULE)
+    next_slot = get_next_optimal_slot(current_time)
     weekly = generate_weekly_schedule()
     
+    # One clock read for the whole run, formatted once
+    current_time_str = current_time.strftime("%Y-%m-%d %H:%M %Z")
+    generated_at = current_time.astimezone(pytz.UTC).isoformat()
+    
     # Get pillar info for current content type
     current_pillar = CONTENT_PILLARS.get(content_type, {})
     
@@ -169,7 +214,7 @@ def main():
         },
         "decision": {
             "should_post_now": should_post,
-            "current_time": current_time.strftime("%Y-%m-%d %H:%M %Z"),
+            "current_time": current_time_str,
             "current_priority": priority,
             "current_content_type": content_type,
             "current_pillar": current_pillar,
@@ -180,26 +225,34 @@ def main():
             "weekly_schedule": weekly
         },
         "content_pillars": CONTENT_PILLARS,
-        "generated_at": datetime.now(pytz.UTC).isoformat()
+        "generated_at": generated_at
     }
     
     # Save to file
     os.makedirs("tmp", exist_ok=True)
-    with open("tmp/posting_schedule.json", "w") as f:
-        json.dump(output, f, indent=2)
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(output, indent=2).encode("utf-8")
+    with open("tmp/posting_schedule.json", "wb") as f:
+        f.write(payload)
     
     # Print summary
-    print_summary(should_post, current_time, priority, content_type, next_slot, weekly)
+    if LOG_SUMMARY:
+        print_summary(should_post, current_time, priority, content_type, next_slot, weekly)
     
     # Set GitHub output
-    if "GITHUB_OUTPUT" in os.environ:
-        with open(os.environ["GITHUB_OUTPUT"], "a") as f:
-            f.write(f"should_post={'true' if should_post else 'false'}\n")
-            f.write(f"priority={priority}\n")
-            f.write(f"content_type={content_type}\n")
-            f.write(f"current_time={current_time.strftime('%Y-%m-%d %H:%M %Z')}\n")
-            f.write(f"pillar_description={current_pillar.get('description', 'N/A')}\n")
-            f.write(f"emotional_tone={current_pillar.get('emotional_tone', 'N/A')}\n")
+    if GITHUB_OUTPUT:
+        lines = [
+            f"should_post={'true' if should_post else 'false'}",
+            f"priority={priority}",
+            f"content_type={content_type}",
+            f"current_time={current_time_str}",
+            f"pillar_description={current_pillar.get('description', 'N/A')}",
+            f"emotional_tone={current_pillar.get('emotional_tone', 'N/A')}"
+        ]
+        with open(GITHUB_OUTPUT, "a") as f:
+            f.write("\n".join(lines) + "\n")
 
 def get_posting_reason(should_post, priority, content_type):
     """Get human-readable reason for posting decision"""
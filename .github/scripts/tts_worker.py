@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🎙️ Coqui TTS Worker - keeps the voice model warm between synthesis jobs
+
+Started on demand by generate_tts.py when TTS_WORKER=1.
+- Loads PRIMARY_MODEL once, then listens on a Unix socket
+- Each connection sends one JSON line: {text, speaker, speed, out, model}
+- Replies with {"ok": true} or {"ok": false, "error": "..."}
+- Exits after TTS_WORKER_IDLE seconds without a job
+"""
+
+import os
+import sys
+import json
+import socketserver
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_tts import get_tts, synthesize_to_file, PRIMARY_MODEL, TTS_WORKER_SOCKET
+
+IDLE_TIMEOUT = int(os.getenv('TTS_WORKER_IDLE', '600'))
+
+
+class SynthesisHandler(socketserver.StreamRequestHandler):
+    """Handle a single synthesis job per connection"""
+    
+    def handle(self):
+        try:
+            job = json.loads(self.rfile.readline())
+            tts = get_tts(job.get('model', PRIMARY_MODEL))
+            synthesize_to_file(tts, job['text'], job['out'], job['speaker'], job['speed'])
+            reply = {'ok': True}
+            print(f"✅ Synthesized {len(job['text'])} chars -> {job['out']}", flush=True)
+        except Exception as e:
+            reply = {'ok': False, 'error': str(e)}
+            print(f"⚠️ Job failed: {e}", flush=True)
+        
+        self.wfile.write((json.dumps(reply) + '\n').encode('utf-8'))
+
+
+class WorkerServer(socketserver.UnixStreamServer):
+    """Unix socket server that notes when it has been idle for too long"""
+    
+    idle = False
+    
+    def handle_timeout(self):
+        self.idle = True
+
+
+def main():
+    # Warm the model before binding so clients only connect once it's ready
+    get_tts(PRIMARY_MODEL)
+    
+    # Bind and listen on a private path, then rename it into place: clients treat
+    # the socket path existing as "ready", so it must never appear before listen()
+    staging_path = f"{TTS_WORKER_SOCKET}.{os.getpid()}"
+    if os.path.exists(staging_path):
+        os.remove(staging_path)
+    
+    server = WorkerServer(staging_path, SynthesisHandler)
+    server.timeout = IDLE_TIMEOUT
+    os.replace(staging_path, TTS_WORKER_SOCKET)
+    socket_inode = os.stat(TTS_WORKER_SOCKET).st_ino
+    print(f"🎙️ TTS worker ready on {TTS_WORKER_SOCKET} (idle timeout {IDLE_TIMEOUT}s)", flush=True)
+    
+    try:
+        while not server.idle:
+            server.handle_request()
+    finally:
+        server.server_close()
+        # Only unlink the path if it is still ours (not a newer worker's socket)
+        try:
+            if os.stat(TTS_WORKER_SOCKET).st_ino == socket_inode:
+                os.remove(TTS_WORKER_SOCKET)
+        except FileNotFoundError:
+            pass
+        print("👋 TTS worker stopped (idle)", flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -108,24 +108,10 @@ class YouTubeUploader(PlatformUploader):
             print("📺 YOUTUBE UPLOAD")
             print("="*60)
             
-            # Store original video path for other platforms
-            original_video = video_path
-            
             # Import and execute YouTube upload module
+            # (it links the video under its title, so short.mp4 stays in place for other platforms)
             import upload_youtube
             
-            # CRITICAL: Restore the original video path if YouTube renamed it
-            # This ensures other platforms can find the video
-            import glob
-            renamed_videos = glob.glob(os.path.join(TMP, "*_AI_*.mp4"))
-            if renamed_videos and not os.path.exists(original_video):
-                # YouTube renamed it, copy it back
-                import shutil
-                renamed_video = renamed_videos[0]
-                if os.path.exists(renamed_video):
-                    shutil.copy2(renamed_video, original_video)
-                    print(f"📋 Restored original video path for other platforms")
-            
             # The module executes automatically and saves to upload_history.json
             # Read the result from the log
             if os.path.exists(UPLOAD_LOG):
@@ -7,6 +7,10 @@ With fallback: use platform URLs if Cloudinary fails
 import os
 import sys
 import json
+from datetime import datetime, timezone
+
+# Bytes per Cloudinary upload_large chunk
+CHUNK_SIZE = 20_000_000
 
 def upload_video_for_makecom(video_path):
     """
@@ -40,10 +44,11 @@ def upload_video_for_makecom(video_path):
         print(f"   Video: {os.path.basename(video_path)}")
         print(f"   Size: {os.path.getsize(video_path) / (1024*1024):.2f} MB")
         
-        # Upload
-        result = cloudinary.uploader.upload(
+        # Chunked upload: a failed chunk is retried on its own instead of the whole file
+        result = cloudinary.uploader.upload_large(
             video_path,
             resource_type="video",
+            chunk_size=CHUNK_SIZE,
             folder="motivation_shorts",
             public_id=f"video_{os.getenv('GITHUB_RUN_NUMBER', 'test')}",
             overwrite=True,
@@ -97,14 +102,19 @@ def get_fallback_video_url():
                 latest = log[-1]
                 results = latest.get('results', [])
                 
+                # First URL per platform, indexed in one pass
+                url_by_platform = {}
+                for result in results:
+                    if result.get('url'):
+                        url_by_platform.setdefault(result.get('platform'), result['url'])
+                
                 # Priority: YouTube > Facebook > TikTok > Instagram
-                for platform in ['youtube', 'facebook', 'tiktok', 'instagram']:
-                    for result in results:
-                        if result.get('platform') == platform and result.get('url'):
-                            url = result['url']
-                            print(f"✅ Using {platform.upper()} URL as fallback")
-                            print(f"   {url}")
-                            return url
+                for platform in ('youtube', 'facebook', 'tiktok', 'instagram'):
+                    url = url_by_platform.get(platform)
+                    if url:
+                        print(f"✅ Using {platform.upper()} URL as fallback")
+                        print(f"   {url}")
+                        return url
         
         except Exception as e:
             print(f"⚠️ Could not read platform URLs: {e}")
@@ -167,7 +177,7 @@ def main():
         "video_name": os.path.basename(video_path),
         "video_size_mb": round(os.path.getsize(video_path) / (1024*1024), 2),
         "source": "cloudinary" if "cloudinary" in video_url else "platform_upload",
-        "timestamp": os.popen('date -u +%Y-%m-%dT%H:%M:%SZ').read().strip()
+        "timestamp": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     }
     
     with open("tmp/video_metadata.json", "w") as f:
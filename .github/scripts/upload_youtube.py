@@ -1,27 +1,71 @@
 import os
+import io
 import json
+import mmap
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload, DEFAULT_HTTP_TIMEOUT_SEC
 from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
-from tenacity import retry, stop_after_attempt, wait_exponential
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import re 
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 TMP = os.getenv("GITHUB_WORKSPACE", ".") + "/tmp"
 VIDEO = os.path.join(TMP, "short.mp4")
 THUMB = os.path.join(TMP, "thumbnail.png")
 READY_VIDEO = os.path.join(TMP, "short_ready.mp4")
 UPLOAD_LOG = os.path.join(TMP, "upload_history.json")
+YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+
+# Resumable upload chunk size (YT_CHUNK_MB, a multiple of 256 KiB); files up to
+# SINGLE_CHUNK_MAX_MB are read into memory and sent as one multipart request
+UPLOAD_CHUNK_SIZE = int(os.getenv("YT_CHUNK_MB", "16")) * 1024 * 1024
+SINGLE_CHUNK_MAX_MB = 50
+UPLOAD_NUM_RETRIES = 5  # googleapiclient backoff retries per request / per chunk
+SOCKET_SNDBUF = 8 * 1024 * 1024  # kernel send buffer requested for upload sockets
+THUMB_MAX_MB = 2  # YouTube thumbnail size limit
+THUMB_MAX_SIZE = (1280, 720)  # YouTube's largest thumbnail resolution
+_UNSAFE_TITLE_RE = re.compile(r'[^\w\s-]')
+UTF8_BOM = b'\xef\xbb\xbf'
 
 # 🔥 LEGION CHANNEL CONFIG
 CHANNEL_NAME = "The 5AM Legion"
 CHANNEL_TAGLINE = "Unleashing potential before sunrise 🔥"
 
+def read_json(path):
+    """Parse a JSON file, tolerating a UTF-8 BOM; with orjson it parses straight from an mmap"""
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return orjson.loads(b'')
+            offset = 3 if mm[:3] == UTF8_BOM else 0
+            with mm, memoryview(mm)[offset:] as body:
+                return orjson.loads(body)
+        raw = f.read().removeprefix(UTF8_BOM)
+    return json.loads(raw)
+
+
+def dump_json(obj):
+    """Serialize to compact UTF-8 JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 # ---- Load Global Metadata ONCE ----
 try:
-    with open(os.path.join(TMP, "script.json"), "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(os.path.join(TMP, "script.json"))
 except FileNotFoundError:
     print("❌ Error: script.json not found.")
     raise
@@ -32,32 +76,63 @@ hashtags = data.get("hashtags", ["#motivation", "#selfimprovement", "#shorts"])
 topic = data.get("topic", "motivation")
 
 # ---- Step 1: Validate video ----
-if not os.path.exists(VIDEO):
+try:
+    video_size_mb = os.stat(VIDEO).st_size / (1024 * 1024)
+except FileNotFoundError:
     raise FileNotFoundError(f"Video file not found: {VIDEO}")
 
-video_size_mb = os.path.getsize(VIDEO) / (1024 * 1024)
 print(f"📹 Motivational video file found: {VIDEO} ({video_size_mb:.2f} MB)")
 if video_size_mb < 0.1:
     raise ValueError("Video file is too small, likely corrupted")
 
-# ---- Step 2: Rename video to safe filename ----
-safe_title = re.sub(r'[^\w\s-]', '', title).strip().replace(' ', '_')
+# ---- Step 2: Link video to safe filename (short.mp4 stays for retries and other platforms) ----
+safe_title = _UNSAFE_TITLE_RE.sub('', title).strip().replace(' ', '_')
 video_output_path = os.path.join(TMP, f"{safe_title}.mp4")
 
 if VIDEO != video_output_path:
-    if os.path.exists(VIDEO):
+    # VIDEO was stat'ed in step 1, so only the link itself can fail here
+    try:
         try:
-            os.rename(VIDEO, video_output_path)
-            VIDEO = video_output_path
-            print(f"🎬 Final motivational video renamed to: {video_output_path}")
-        except Exception as e:
-            print(f"⚠️ Renaming failed: {e}. Using original path.")
-    else:
-        print("⚠️ Video file not found before rename.")
+            os.remove(video_output_path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(VIDEO, video_output_path)
+        except OSError:
+            os.symlink(os.path.abspath(VIDEO), video_output_path)
+        VIDEO = video_output_path
+        print(f"🎬 Final motivational video linked as: {video_output_path}")
+    except Exception as e:
+        print(f"⚠️ Linking failed: {e}. Using original path.")
 else:
     print("🎬 Video already has the correct filename.")
 
 # ---- Step 3: Authenticate ----
+class TunedHTTPSConnection(httplib2.HTTPSConnectionWithTimeout):
+    """HTTPS connection with Nagle disabled and a larger send buffer for multi-MiB upload bodies"""
+
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF)
+
+
+class TunedHttp(httplib2.Http):
+    """httplib2.Http that opens HTTPS connections through TunedHTTPSConnection"""
+
+    def __init__(self, **kwargs):
+        # Same defaults googleapiclient's build_http() would apply
+        kwargs.setdefault("timeout", socket.getdefaulttimeout() or DEFAULT_HTTP_TIMEOUT_SEC)
+        super().__init__(**kwargs)
+        # YouTube answers resumable chunks with 308 "Resume Incomplete"; it must not be followed
+        self.redirect_codes = self.redirect_codes - {308}
+
+    def request(self, uri, method="GET", body=None, headers=None,
+                redirections=httplib2.DEFAULT_MAX_REDIRECTS, connection_type=None):
+        if connection_type is None and uri.startswith("https:"):
+            connection_type = TunedHTTPSConnection
+        return super().request(uri, method, body, headers, redirections, connection_type)
+
 try:
     creds = Credentials(
         None,
@@ -65,9 +140,11 @@ try:
         token_uri="https://oauth2.googleapis.com/token",
         client_id=os.getenv("GOOGLE_CLIENT_ID"),
         client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
-        scopes=["https://www.googleapis.com/auth/youtube.upload"]
+        scopes=YOUTUBE_SCOPES
     )
-    youtube = build("youtube", "v3", credentials=creds, cache_discovery=False)
+    # One authorized keep-alive transport shared by the video and thumbnail uploads
+    authed_http = AuthorizedHttp(creds, http=TunedHttp())
+    youtube = build("youtube", "v3", http=authed_http, cache_discovery=False, static_discovery=True)
     print("✅ YouTube API authenticated")
 except Exception as e:
     print(f"❌ Authentication failed: {e}")
@@ -116,15 +193,18 @@ legion_base_tags = [
     "inspirational"
 ]
 
-# Combine with script hashtags
-tags = legion_base_tags.copy()
-if hashtags:
-    tags.extend([tag.replace('#', '').lower() for tag in hashtags[:10]])
-tags.append("shorts")
-tags.append("inspiring")
-
-# Remove duplicates and limit to 15 tags (YouTube limit is 500 chars, ~15 tags is safe)
-tags = list(dict.fromkeys(tags))[:15]
+# Combine with script hashtags, removing duplicates and stopping at 15 tags
+# (YouTube limit is 500 chars, ~15 tags is safe)
+tags = []
+seen_tags = set()
+for tag in chain(legion_base_tags,
+                 (tag.replace('#', '').lower() for tag in hashtags[:10]),
+                 ("shorts", "inspiring")):
+    if tag not in seen_tags:
+        seen_tags.add(tag)
+        tags.append(tag)
+        if len(tags) == 15:
+            break
 
 print(f"📝 Motivational metadata ready:")
 print(f"   Title: {title}")
@@ -150,11 +230,50 @@ body = {
 
 print(f"📤 Uploading motivational video to YouTube...")
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=2, min=4, max=60))
+class PrefetchFileUpload(MediaFileUpload):
+    """Resumable MediaFileUpload that reads chunk N+1 from disk while chunk N is sent."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetched = None  # (begin, length, future)
+
+    def has_stream(self):
+        # Keep googleapiclient on the getbytes() path so every chunk goes through the prefetcher
+        return False
+
+    def _read(self, begin, length):
+        return os.pread(self._fd.fileno(), length, begin)
+
+    def getbytes(self, begin, length):
+        pending = self._prefetched
+        if pending and pending[:2] == (begin, length):
+            data = pending[2].result()
+        else:
+            data = self._read(begin, length)
+
+        next_begin = begin + len(data)
+        if next_begin < self.size():
+            self._prefetched = (next_begin, length, self._prefetch_pool.submit(self._read, next_begin, length))
+        else:
+            self._prefetched = None
+        return data
+
 def upload_video(youtube_client, video_path, metadata):
-    media = MediaFileUpload(
+    size_mb = os.path.getsize(video_path) / (1024 * 1024)
+    if size_mb <= SINGLE_CHUNK_MAX_MB:
+        with open(video_path, "rb") as fh:
+            buf = io.BytesIO(fh.read())
+        media = MediaIoBaseUpload(buf, mimetype="video/mp4", chunksize=-1, resumable=False)
+        return youtube_client.videos().insert(
+            part="snippet,status",
+            body=metadata,
+            media_body=media
+        ).execute(num_retries=UPLOAD_NUM_RETRIES)
+
+    media = PrefetchFileUpload(
         video_path,
-        chunksize=1024*1024,
+        chunksize=UPLOAD_CHUNK_SIZE,
         resumable=True,
         mimetype="video/mp4"
     )
@@ -169,7 +288,8 @@ def upload_video(youtube_client, video_path, metadata):
     last_progress = 0
     
     while response is None:
-        status, response = request.next_chunk()
+        # Transient failures retry this chunk only, resuming from the last acknowledged byte
+        status, response = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
         if status:
             progress = int(status.progress() * 100)
             if progress != last_progress and progress % 10 == 0:
@@ -177,6 +297,29 @@ def upload_video(youtube_client, video_path, metadata):
                 last_progress = progress
     return response
 
+def compress_thumbnail(thumb_path):
+    """Downscale an oversized thumbnail to 1280x720 progressive JPEG and return the new path."""
+    from PIL import Image  # only needed for oversized thumbnails
+
+    output_path = os.path.splitext(thumb_path)[0] + ".jpg"
+    img = Image.open(thumb_path).convert("RGB")
+    img.thumbnail(THUMB_MAX_SIZE, Image.Resampling.LANCZOS)
+    img.save(output_path, "JPEG", quality=85, progressive=True, optimize=False)
+    return output_path
+
+# Compress the thumbnail in the background while the video uploads
+thumb_future = None
+try:
+    thumb_size_mb = os.stat(THUMB).st_size / (1024*1024)
+except FileNotFoundError:
+    thumb_size_mb = None
+
+if thumb_size_mb is not None and thumb_size_mb > THUMB_MAX_MB:
+    print(f"⚠️ Compressing thumbnail ({thumb_size_mb:.2f}MB) during upload...")
+    thumb_executor = ThreadPoolExecutor(max_workers=1)
+    thumb_future = thumb_executor.submit(compress_thumbnail, THUMB)
+    thumb_executor.shutdown(wait=False)
+
 try:
     print("🚀 Starting motivational video upload...")
     result = upload_video(youtube, VIDEO, body)
@@ -199,17 +342,15 @@ except Exception as e:
     raise
 
 # ---- Step 6: Set thumbnail (desktop view) ----
-if os.path.exists(THUMB):
+if thumb_size_mb is not None:
     try:
         print("🖼️ Setting motivational thumbnail for desktop views...")
-        thumb_size_mb = os.path.getsize(THUMB) / (1024*1024)
-        if thumb_size_mb > 2:
-            print(f"⚠️ Compressing thumbnail ({thumb_size_mb:.2f}MB)...")
+        thumb_path = thumb_future.result() if thumb_future else THUMB
         
         youtube.thumbnails().set(
             videoId=video_id, 
-            media_body=MediaFileUpload(THUMB)
-        ).execute()
+            media_body=MediaFileUpload(thumb_path)
+        ).execute(http=authed_http)
         print("✅ Motivational thumbnail set successfully (desktop view).")
     except Exception as e:
         print(f"⚠️ Thumbnail upload failed: {e}")
@@ -233,38 +374,50 @@ upload_metadata = {
 }
 
 history = []
-if os.path.exists(UPLOAD_LOG):
-    try:
-        with open(UPLOAD_LOG, 'r') as f:
-            history = json.load(f)
-    except:
-        history = []
+try:
+    history = read_json(UPLOAD_LOG)
+except FileNotFoundError:
+    pass
+except (OSError, ValueError) as e:
+    # Keep the damaged log for inspection instead of silently overwriting it
+    print(f"⚠️ Upload history unreadable ({e}), moved to {UPLOAD_LOG}.corrupt")
+    os.replace(UPLOAD_LOG, UPLOAD_LOG + ".corrupt")
+
+if not isinstance(history, list):
+    history = []
 
 history.append(upload_metadata)
 history = history[-100:]  # Keep last 100 uploads
 
-with open(UPLOAD_LOG, 'w') as f:
-    json.dump(history, f, indent=2)
+# Compact single write, swapped in atomically; manage_playlists and upload_multiplatform
+# read this file as one JSON list, so it stays a list rather than JSON Lines
+payload = dump_json(history)
+with open(UPLOAD_LOG + ".tmp", 'wb') as f:
+    f.write(payload)
+os.replace(UPLOAD_LOG + ".tmp", UPLOAD_LOG)
 
 # 🔥 Analytics summary
 total_uploads = len(history)
 print(f"\n📊 Channel Stats: {total_uploads} motivational videos uploaded total")
 
-print("\n" + "="*70)
-print("🔥 MOTIVATIONAL VIDEO UPLOAD COMPLETE!")
-print("="*70)
-print(f"🔔 Channel: {CHANNEL_NAME}")
-print(f"📹 Title: {title}")
-print(f"🏷️  Topic: {topic}")
-print(f"🆔 Video ID: {video_id}")
-print(f"🔗 Shorts URL: {shorts_url}")
-print(f"#️⃣  Hashtags: {' '.join(hashtags[:5])}")
-print(f"🏷️  Tags: {', '.join(tags[:8])}...")
-print("="*70)
-print("\n💡 Motivational Channel Tips:")
-print("   • Best posting time: 5-7 AM (peak morning motivation)")
-print("   • Post consistently to build a routine")
-print("   • Engage with comments within 1 hour for algorithm boost")
-print("   • Cross-post to Instagram at 7 AM")
-print(f"\n🔗 Share this URL: {shorts_url}")
-print("🔥 Keep the Legion growing! 💪")
\ No newline at end of file
+# Final summary emitted as one write so it lands in the CI log as a single block
+print("\n".join([
+    "\n" + "="*70,
+    "🔥 MOTIVATIONAL VIDEO UPLOAD COMPLETE!",
+    "="*70,
+    f"🔔 Channel: {CHANNEL_NAME}",
+    f"📹 Title: {title}",
+    f"🏷️  Topic: {topic}",
+    f"🆔 Video ID: {video_id}",
+    f"🔗 Shorts URL: {shorts_url}",
+    f"#️⃣  Hashtags: {' '.join(hashtags[:5])}",
+    f"🏷️  Tags: {', '.join(tags[:8])}...",
+    "="*70,
+    "\n💡 Motivational Channel Tips:",
+    "   • Best posting time: 5-7 AM (peak morning motivation)",
+    "   • Post consistently to build a routine",
+    "   • Engage with comments within 1 hour for algorithm boost",
+    "   • Cross-post to Instagram at 7 AM",
+    f"\n🔗 Share this URL: {shorts_url}",
+    "🔥 Keep the Legion growing! 💪",
+]))
@@ -13,11 +13,24 @@ Features:
 
 import os
 import json
-import subprocess
 import sys
-from datetime import datetime
+import time
+from bisect import bisect_right
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 TMP = os.getenv("GITHUB_WORKSPACE", ".") + "/tmp"
+VIDEO_FILE = os.path.join(TMP, "short.mp4")
+AUDIO_FILE = os.path.join(TMP, "voice.mp3")
+SCRIPT_FILE = os.path.join(TMP, "script.json")
+AUDIO_METADATA_FILE = os.path.join(TMP, "audio_metadata.json")
+VIDEO_VALIDATION_FILE = os.path.join(TMP, "video_validation.json")
+REPORT_FILE = os.path.join(TMP, "duration_validation.json")
+PROBE_CACHE_FILE = os.path.join(TMP, ".probe_cache.json")
 
 # Duration targets (seconds)
 TARGET_MIN = 9.0
@@ -28,54 +41,171 @@ OPTIMAL_MAX = 15.0
 # Validation mode
 STRICT_MODE = os.getenv('STRICT_VALIDATION', 'false').lower() == 'true'
 
+# Seconds before a hung ffprobe is abandoned
+FFPROBE_TIMEOUT = float(os.getenv('FFPROBE_TIMEOUT', '15'))
+PROBE_WORKERS = os.cpu_count() or 4
+
+# Grading ladders: bisect_right(thresholds, value) indexes the (label, message) tiers;
+# a None message means the last tier, which is reported as a warning
+DRIFT_THRESHOLDS = (0.05, 0.5)
+DRIFT_TIERS = (
+    ('PERFECT', "✅ NEAR-PERFECT sync (<50ms)"),
+    ('EXCELLENT', "✅ Excellent sync (<500ms)"),
+    ('ACCEPTABLE', None),
+)
+ESTIMATION_THRESHOLDS = (1.0, 2.0)
+ESTIMATION_TIERS = (
+    ('GOOD', "✅ Estimation accurate (error: {error:.2f}s)"),
+    ('ACCEPTABLE', "⚠️ Estimation acceptable (error: {error:.2f}s)"),
+    ('POOR', None),
+)
+
+# Files smaller than this are truncated/failed renders; no need to probe them
+MIN_MEDIA_BYTES = 1024
+
+# ffprobe argv (minus the input path); format=duration comes from container
+# headers, so stream packet analysis is kept to a minimum
+FFPROBE_DURATION_ARGS = (
+    'ffprobe',
+    '-v', 'error',
+    '-analyzeduration', '100000',
+    '-probesize', '500000',
+    '-print_format', 'json',
+    '-show_entries', 'format=duration',
+)
+
+
+def now_iso():
+    """Local timestamp in ISO-8601 form (seconds precision) without importing datetime"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def read_json(path):
+    """Parse a JSON file from one binary read (orjson when installed)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
-def get_video_duration(video_path):
-    """Get actual video duration using ffprobe"""
+
+def dump_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def probe_duration(path):
+    """
+    Get one file's duration (None if unreadable)
+    Reads the MP4 mvhd / MP3 frame headers in-process with mutagen; falls back
+    to ffprobe when mutagen is missing or cannot parse the container.
+    """
+    try:
+        import mutagen
+        media = mutagen.File(path)
+        if media is not None and media.info.length > 0:
+            return float(media.info.length)
+    except Exception:
+        pass
+    
+    import subprocess  # only needed when mutagen can't read the file
     try:
-        result = subprocess.run([
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            video_path
-        ], capture_output=True, text=True, check=True)
+        result = subprocess.run(
+            (*FFPROBE_DURATION_ARGS, path),
+            capture_output=True, text=True, check=True, timeout=FFPROBE_TIMEOUT
+        )
         
-        duration = float(result.stdout.strip())
-        return duration
+        return float(json.loads(result.stdout)['format']['duration'])
+    except subprocess.TimeoutExpired:
+        print(f"⚠️ ffprobe timed out after {FFPROBE_TIMEOUT:g}s on {os.path.basename(path)}")
+        return None
     except Exception as e:
-        print(f"❌ Could not read video duration: {e}")
+        print(f"⚠️ Could not read duration of {os.path.basename(path)}: {e}")
         return None
 
 
-def get_audio_duration(audio_path):
-    """Get audio duration using ffprobe"""
+def stat_or_none(path):
+    """Single stat() used for both the existence check and the cache key"""
     try:
-        result = subprocess.run([
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            audio_path
-        ], capture_output=True, text=True, check=True)
-        
-        duration = float(result.stdout.strip())
-        return duration
-    except Exception as e:
-        print(f"⚠️ Could not read audio duration: {e}")
+        return os.stat(path)
+    except FileNotFoundError:
         return None
 
 
+def probe_cache_key(path, st):
+    """Cache key that changes whenever the file is rewritten (path, size, mtime)"""
+    return f"{path}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def load_probe_cache():
+    """Load cached durations from earlier runs/retries"""
+    try:
+        return read_json(PROBE_CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_probe_cache(cache):
+    """Write the probe cache atomically"""
+    tmp_path = PROBE_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(dump_json(cache))
+        os.replace(tmp_path, PROBE_CACHE_FILE)
+    except OSError as e:
+        print(f"⚠️ Could not save probe cache: {e}")
+
+
+def get_durations(file_stats):
+    """
+    Get media durations for several files in one pass
+    
+    Args:
+        file_stats: {path: os.stat_result} for files already known to exist
+    
+    Files unchanged since an earlier run are answered from PROBE_CACHE_FILE.
+    ffprobe only accepts a single input, so the remaining probes run
+    concurrently (up to PROBE_WORKERS at a time) and their subprocess
+    latencies overlap instead of adding up.
+    
+    Returns:
+        {path: duration_seconds or None}
+    """
+    cache = load_probe_cache()
+    keys = {path: probe_cache_key(path, st) for path, st in file_stats.items()}
+    durations = {path: cache[key] for path, key in keys.items() if key in cache}
+    
+    missing = [path for path in file_stats if path not in durations]
+    if not missing:
+        return durations
+    
+    if len(missing) == 1:
+        durations[missing[0]] = probe_duration(missing[0])
+    else:
+        # Bounded pool; results are collected as each probe finishes
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        workers = min(len(missing), PROBE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(probe_duration, path): path for path in missing}
+            for future in as_completed(futures):
+                durations[futures[future]] = future.result()
+    
+    save_probe_cache({
+        key: durations[path] for path, key in keys.items()
+        if durations[path] is not None
+    })
+    return durations
+
+
 def load_metadata_file(filepath, name):
     """Load and validate metadata JSON file"""
-    if not os.path.exists(filepath):
-        print(f"⚠️ {name} not found: {filepath}")
-        return None
-    
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(filepath)
         print(f"✅ Loaded {name}")
         return data
+    except FileNotFoundError:
+        print(f"⚠️ {name} not found: {filepath}")
+        return None
     except Exception as e:
         print(f"⚠️ Could not load {name}: {e}")
         return None
@@ -98,7 +228,7 @@ def validate_video():
     print("")
     
     validation_report = {
-        'validated_at': datetime.now().isoformat(),
+        'validated_at': now_iso(),
         'target_min': TARGET_MIN,
         'target_max': TARGET_MAX,
         'optimal_min': OPTIMAL_MIN,
@@ -112,9 +242,10 @@ def validate_video():
     
     # Check 1: Video file exists
     print("📹 Checking video file...")
-    video_path = os.path.join(TMP, "short.mp4")
+    video_path = VIDEO_FILE
+    video_stat = stat_or_none(video_path)
     
-    if not os.path.exists(video_path):
+    if video_stat is None:
         error = f"Video file not found: {video_path}"
         print(f"❌ {error}")
         validation_report['errors'].append(error)
@@ -125,9 +256,44 @@ def validate_video():
     validation_report['checks']['video_exists'] = True
     print(f"✅ Video file exists: {video_path}")
     
+    if video_stat.st_size < MIN_MEDIA_BYTES:
+        error = f"Video implausibly small: {video_stat.st_size} bytes"
+        print(f"❌ {error}")
+        validation_report['errors'].append(error)
+        validation_report['checks']['duration_readable'] = False
+        validation_report['overall_status'] = 'FAILED'
+        return False, validation_report
+    
+    # create_video.py already probed the render; trust its duration when
+    # video_validation.json was written after the video was last modified
+    video_validation = load_metadata_file(VIDEO_VALIDATION_FILE, "video_validation.json")
+    upstream_duration = None
+    if isinstance(video_validation, dict):
+        recorded = video_validation.get('actual_duration')
+        video_validation_stat = stat_or_none(VIDEO_VALIDATION_FILE)
+        if (isinstance(recorded, (int, float)) and recorded > 0 and video_validation_stat
+                and video_validation_stat.st_mtime_ns >= video_stat.st_mtime_ns):
+            upstream_duration = float(recorded)
+    
+    # Probe video and audio durations together, once
+    audio_path = AUDIO_FILE
+    audio_stat = stat_or_none(audio_path)
+    audio_exists = audio_stat is not None
+    
+    if audio_exists and audio_stat.st_size < MIN_MEDIA_BYTES:
+        print(f"⚠️ Audio implausibly small ({audio_stat.st_size} bytes), not probing it")
+    
+    file_stats = {} if upstream_duration else {video_path: video_stat}
+    if audio_exists and audio_stat.st_size >= MIN_MEDIA_BYTES:
+        file_stats[audio_path] = audio_stat
+    durations = get_durations(file_stats) if file_stats else {}
+    if upstream_duration:
+        print(f"♻️ Using render duration from video_validation.json ({upstream_duration:.2f}s)")
+        durations[video_path] = upstream_duration
+    
     # Check 2: Get video duration
     print("\n⏱️ Checking video duration...")
-    video_duration = get_video_duration(video_path)
+    video_duration = durations[video_path]
     
     if video_duration is None:
         error = "Could not determine video duration"
@@ -182,10 +348,8 @@ def validate_video():
     
     # Check 4: Audio sync
     print("\n🔊 Checking audio sync...")
-    audio_path = os.path.join(TMP, "voice.mp3")
-    
-    if os.path.exists(audio_path):
-        audio_duration = get_audio_duration(audio_path)
+    if audio_exists:
+        audio_duration = durations.get(audio_path)
         
         if audio_duration:
             validation_report['audio_duration'] = round(audio_duration, 2)
@@ -199,17 +363,14 @@ def validate_video():
             
             validation_report['drift_ms'] = round(drift_ms, 0)
             
-            if drift < 0.05:
-                print(f"   ✅ NEAR-PERFECT sync (<50ms)")
-                validation_report['checks']['audio_sync'] = 'PERFECT'
-            elif drift < 0.5:
-                print(f"   ✅ Excellent sync (<500ms)")
-                validation_report['checks']['audio_sync'] = 'EXCELLENT'
+            label, message = DRIFT_TIERS[bisect_right(DRIFT_THRESHOLDS, drift)]
+            validation_report['checks']['audio_sync'] = label
+            if message:
+                print(f"   {message}")
             else:
                 warning = f"Audio/video drift {drift_ms:.0f}ms exceeds 500ms"
                 print(f"   ⚠️ {warning}")
                 validation_report['warnings'].append(warning)
-                validation_report['checks']['audio_sync'] = 'ACCEPTABLE'
         else:
             validation_report['checks']['audio_sync'] = 'UNKNOWN'
     else:
@@ -219,20 +380,8 @@ def validate_video():
     # Check 5: Metadata files
     print("\n📋 Checking metadata files...")
     
-    script_data = load_metadata_file(
-        os.path.join(TMP, "script.json"),
-        "script.json"
-    )
-    
-    audio_metadata = load_metadata_file(
-        os.path.join(TMP, "audio_metadata.json"),
-        "audio_metadata.json"
-    )
-    
-    video_validation = load_metadata_file(
-        os.path.join(TMP, "video_validation.json"),
-        "video_validation.json"
-    )
+    script_data = load_metadata_file(SCRIPT_FILE, "script.json")
+    audio_metadata = load_metadata_file(AUDIO_METADATA_FILE, "audio_metadata.json")
     
     validation_report['checks']['script_metadata_exists'] = script_data is not None
     validation_report['checks']['audio_metadata_exists'] = audio_metadata is not None
@@ -254,54 +403,49 @@ def validate_video():
             
             estimation_error = abs(video_duration - estimated_duration)
             
-            if estimation_error < 1.0:
-                print(f"   ✅ Estimation accurate (error: {estimation_error:.2f}s)")
-                validation_report['checks']['estimation_accuracy'] = 'GOOD'
-            elif estimation_error < 2.0:
-                print(f"   ⚠️ Estimation acceptable (error: {estimation_error:.2f}s)")
-                validation_report['checks']['estimation_accuracy'] = 'ACCEPTABLE'
+            label, message = ESTIMATION_TIERS[bisect_right(ESTIMATION_THRESHOLDS, estimation_error)]
+            validation_report['checks']['estimation_accuracy'] = label
+            if message:
+                print(f"   {message.format(error=estimation_error)}")
             else:
                 warning = f"Estimation error {estimation_error:.2f}s exceeds 2s"
                 print(f"   ⚠️ {warning}")
                 validation_report['warnings'].append(warning)
-                validation_report['checks']['estimation_accuracy'] = 'POOR'
     
-    # Determine overall status
-    print("\n" + "="*70)
-    print("📊 VALIDATION SUMMARY")
-    print("="*70)
+    # Determine overall status (summary collected and printed as one block)
+    summary = ["\n" + "="*70, "📊 VALIDATION SUMMARY", "="*70]
     
     has_errors = len(validation_report['errors']) > 0
     has_warnings = len(validation_report['warnings']) > 0
     
     if has_errors:
         validation_report['overall_status'] = 'FAILED'
-        print("❌ VALIDATION FAILED")
-        print(f"\nErrors ({len(validation_report['errors'])}):")
-        for error in validation_report['errors']:
-            print(f"  ❌ {error}")
+        summary.append("❌ VALIDATION FAILED")
+        summary.append(f"\nErrors ({len(validation_report['errors'])}):")
+        summary.extend(f"  ❌ {error}" for error in validation_report['errors'])
     elif has_warnings:
         validation_report['overall_status'] = 'WARNING'
-        print("⚠️ VALIDATION PASSED WITH WARNINGS")
-        print(f"\nWarnings ({len(validation_report['warnings'])}):")
-        for warning in validation_report['warnings']:
-            print(f"  ⚠️ {warning}")
+        summary.append("⚠️ VALIDATION PASSED WITH WARNINGS")
+        summary.append(f"\nWarnings ({len(validation_report['warnings'])}):")
+        summary.extend(f"  ⚠️ {warning}" for warning in validation_report['warnings'])
     else:
         validation_report['overall_status'] = 'PASSED'
-        print("✅ VALIDATION PASSED")
-        print("   All checks passed successfully!")
+        summary.append("✅ VALIDATION PASSED")
+        summary.append("   All checks passed successfully!")
     
-    print("")
-    print(f"Video Duration: {video_duration:.2f}s")
-    print(f"Target Range: {OPTIMAL_MIN}-{OPTIMAL_MAX}s (optimal)")
-    print(f"Status: {validation_report['duration_status']}")
+    summary.extend([
+        "",
+        f"Video Duration: {video_duration:.2f}s",
+        f"Target Range: {OPTIMAL_MIN}-{OPTIMAL_MAX}s (optimal)",
+        f"Status: {validation_report['duration_status']}"
+    ])
+    print("\n".join(summary))
     
     # Save validation report
-    report_path = os.path.join(TMP, "duration_validation.json")
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(validation_report, f, indent=2)
+    with open(REPORT_FILE, 'wb') as f:
+        f.write(dump_json(validation_report, indent=True))
     
-    print(f"\n💾 Validation report saved: {report_path}")
+    print(f"\n💾 Validation report saved: {REPORT_FILE}")
     
     # Return result
     if STRICT_MODE and has_errors:
@@ -318,12 +462,17 @@ def main():
     try:
         is_valid, report = validate_video()
         
-        # Set GitHub Actions output
-        if os.getenv('GITHUB_OUTPUT'):
-            with open(os.getenv('GITHUB_OUTPUT'), 'a') as f:
-                f.write(f"validation_status={report['overall_status']}\n")
-                f.write(f"video_duration={report.get('video_duration', 0)}\n")
-                f.write(f"within_target={'true' if report.get('checks', {}).get('within_acceptable', False) else 'false'}\n")
+        # Set GitHub Actions output (one unbuffered write)
+        github_output = os.getenv('GITHUB_OUTPUT')
+        if github_output:
+            within_target = report.get('checks', {}).get('within_acceptable', False)
+            output = (
+                f"validation_status={report['overall_status']}\n"
+                f"video_duration={report.get('video_duration', 0)}\n"
+                f"within_target={'true' if within_target else 'false'}\n"
+            )
+            with open(github_output, 'ab', buffering=0) as f:
+                f.write(output.encode('utf-8'))
         
         # Exit based on validation result
         if STRICT_MODE and not is_valid: